@@ -0,0 +1,47 @@
+import os
+
+import numpy as np
+import pytest
+
+pytest.importorskip("keras")
+pytest.importorskip("cvzone")
+pytest.importorskip("enchant")
+pytest.importorskip("onnxruntime")
+onnx = pytest.importorskip("onnx")
+from onnx import TensorProto, helper, numpy_helper
+
+from sign_language_recognizer import SignLanguageRecognizer
+
+
+def write_conv_model(path):
+    """Save a one-layer Conv model, the op that dynamic quantization turns into ConvInteger"""
+    weights = np.random.default_rng(0).standard_normal((4, 3, 3, 3)).astype(np.float32)
+    graph = helper.make_graph(
+        [helper.make_node('Conv', ['input', 'w'], ['output'])],
+        'conv',
+        [helper.make_tensor_value_info('input', TensorProto.FLOAT, [1, 3, 8, 8])],
+        [helper.make_tensor_value_info('output', TensorProto.FLOAT, [1, 4, 6, 6])],
+        [numpy_helper.from_array(weights, 'w')],
+    )
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid('', 13)])
+    # IR version matching opset 13, so older runtimes accept the file
+    model.ir_version = 7
+    onnx.save(model, path)
+
+
+def test_int8_session_builds_and_runs(tmp_path):
+    model_file = tmp_path / 'model.h5'
+    model_file.write_bytes(b'')
+    onnx_file = tmp_path / 'model.onnx'
+    write_conv_model(str(onnx_file))
+    # The ONNX export must be newer than the .h5 so it is reused, not re-exported
+    mtime = os.path.getmtime(model_file)
+    os.utime(onnx_file, (mtime + 10, mtime + 10))
+    
+    recognizer = SignLanguageRecognizer.__new__(SignLanguageRecognizer)
+    recognizer.onnx_precision = 'int8'
+    recognizer.load_onnx_session(str(model_file))
+    
+    assert (tmp_path / 'model_uint8.onnx').exists()
+    output = recognizer.session.run(None, {recognizer.input_name: np.ones((1, 3, 8, 8), np.float32)})[0]
+    assert output.shape == (1, 4, 6, 6)
@@ -0,0 +1,134 @@
+import hashlib
+import json
+
+import pytest
+
+import user_auth
+from user_auth import UserAuthentication
+
+
+def make_auth(path):
+    auth = UserAuthentication(str(path))
+    # Flushes are triggered explicitly so tests never race the timer
+    auth.flush_delay = 3600
+    return auth
+
+
+def read_records(path):
+    """Return the user dict stored in a .json file or replayed from a .jsonl log"""
+    if str(path).endswith('.jsonl'):
+        users = {}
+        for line in path.read_text().splitlines():
+            entry = json.loads(line)
+            if entry['op'] == 'upsert':
+                users[entry['u']] = entry['rec']
+            else:
+                users.pop(entry['u'], None)
+        return users
+    return json.loads(path.read_text())
+
+
+@pytest.fixture(params=['users.json', 'users.jsonl'])
+def users_path(request, tmp_path):
+    return tmp_path / request.param
+
+
+def test_register_login_and_change_password(users_path):
+    auth = make_auth(users_path)
+    assert auth.register_user('alice', 'alice@example.com', 'pass123', 'Alice') == \
+        (True, "User registered successfully")
+    assert auth.register_user('bob', 'alice@example.com', 'pass123')[0] is False
+    
+    success, _, user_info = auth.authenticate_user('alice', 'pass123')
+    assert success and 'password' not in user_info
+    assert auth.authenticate_user('alice', 'wrong123')[0] is False
+    assert auth.authenticate_user('nobody', 'pass123')[0] is False
+    
+    assert auth.change_password('alice', 'pass123', 'newpass456')[0] is True
+    assert auth.authenticate_user('alice', 'pass123')[0] is False
+    assert make_auth(users_path).authenticate_user('alice', 'newpass456')[0] is True
+
+
+@pytest.mark.skipif(user_auth._password_hasher is None, reason="argon2-cffi not installed")
+def test_legacy_sha256_hash_is_upgraded_on_login(tmp_path):
+    users_path = tmp_path / 'users.json'
+    users_path.write_text(json.dumps({'legacy': {
+        'username': 'legacy',
+        'email': 'legacy@example.com',
+        'password': hashlib.sha256(b'old123').hexdigest(),
+        'full_name': '',
+        'created_at': '2020-01-01T00:00:00',
+        'last_login': None,
+    }}))
+    auth = make_auth(users_path)
+    
+    assert auth.authenticate_user('legacy', 'old123')[0] is True
+    assert auth.users['legacy']['password'].startswith('$argon2')
+    auth._flush()
+    
+    reloaded = make_auth(users_path)
+    assert reloaded.users['legacy']['password'].startswith('$argon2')
+    assert reloaded.users['legacy']['login_count'] == 1
+    assert reloaded.authenticate_user('legacy', 'old123')[0] is True
+
+
+def test_torn_trailing_log_line_is_skipped_and_repaired(tmp_path):
+    users_path = tmp_path / 'users.jsonl'
+    auth = make_auth(users_path)
+    auth.register_user('alice', 'alice@example.com', 'pass123')
+    with open(users_path, 'ab') as f:
+        f.write(b'{"op":"upsert","u":"bo')
+    
+    reloaded = make_auth(users_path)
+    assert list(reloaded.users) == ['alice']
+    reloaded.register_user('carol', 'carol@example.com', 'pass123')
+    
+    assert sorted(read_records(users_path)) == ['alice', 'carol']
+    assert sorted(make_auth(users_path).users) == ['alice', 'carol']
+
+
+def test_log_replays_after_compaction(tmp_path):
+    users_path = tmp_path / 'users.jsonl'
+    auth = make_auth(users_path)
+    auth.register_user('alice', 'alice@example.com', 'pass123')
+    auth.register_user('bob', 'bob@example.com', 'pass123')
+    for i in range(5):
+        auth.update_user_profile('alice', full_name=f'Alice {i}')
+    auth.delete_user('bob')
+    
+    # Compaction keeps the log within twice the number of users
+    assert len(users_path.read_text().splitlines()) <= 2 * len(auth.users)
+    reloaded = make_auth(users_path)
+    assert reloaded.users == auth.users
+    assert reloaded.users['alice']['full_name'] == 'Alice 4'
+    assert reloaded.register_user('bob', 'bob@example.com', 'pass123')[0] is True
+
+
+def test_login_is_written_by_debounced_flush(users_path):
+    auth = make_auth(users_path)
+    auth.register_user('alice', 'alice@example.com', 'pass123')
+    auth.authenticate_user('alice', 'pass123')
+    auth.authenticate_user('alice', 'pass123')
+    
+    assert read_records(users_path)['alice']['login_count'] == 0
+    auth._flush()
+    assert read_records(users_path)['alice']['login_count'] == 2
+
+
+def test_pending_session_stats_are_merged(users_path):
+    auth = make_auth(users_path)
+    auth.register_user('alice', 'alice@example.com', 'pass123')
+    auth.update_session_stats('alice', 10)
+    auth.update_session_stats('alice', 5)
+    
+    # Buffered until read or written
+    assert auth.users['alice']['session_count'] == 0
+    stats = auth.get_user_stats('alice')
+    assert stats['session_count'] == 2
+    assert stats['total_recognition_time'] == 15
+    
+    auth.update_session_stats('alice', 1)
+    auth.save_users()
+    record = read_records(users_path)['alice']
+    assert record['session_count'] == 3
+    assert record['total_recognition_time'] == 16
@@ -23,6 +23,7 @@ import numpy as np
 import base64
 import json
 import os
+import sys
 from datetime import datetime, timedelta
 import logging
 import threading
@@ -67,6 +68,7 @@ except Exception as e:
 
 # Global variables for camera and recognition state
 camera = None
+camera_lock = threading.Lock()
 camera_active = False
 recognition_active = False
 recognition_start_time = None
@@ -78,23 +80,41 @@ recognition_results = {
     'confidence': 0.0
 }
 
+def open_camera_device(index=0):
+    """Open the capture device, preferring compressed MJPG frames on Linux"""
+    if sys.platform.startswith('linux'):
+        device = cv2.VideoCapture(index, cv2.CAP_V4L2)
+        if device.isOpened():
+            # MJPG must be negotiated before the frame size; it cuts USB traffic
+            # roughly 10x compared to the default raw YUYV stream
+            device.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+        else:
+            device.release()
+            device = cv2.VideoCapture(index)
+    else:
+        device = cv2.VideoCapture(index)
+    
+    device.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
+    device.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+    device.set(cv2.CAP_PROP_FPS, 30)
+    return device
+
 def get_camera():
     """Initialize and return camera object"""
     global camera
-    if camera is None:
-        camera = cv2.VideoCapture(0)
-        camera.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-        camera.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
-        camera.set(cv2.CAP_PROP_FPS, 30)
-    return camera
+    with camera_lock:
+        if camera is None:
+            camera = open_camera_device(0)
+        return camera
 
 def release_camera():
     """Release camera resources"""
     global camera, camera_active
-    if camera is not None:
-        camera.release()
-        camera = None
-    camera_active = False
+    with camera_lock:
+        if camera is not None:
+            camera.release()
+            camera = None
+        camera_active = False
 
 @app.route('/')
 def index():
@@ -290,7 +310,10 @@ def speak_text():
     try:
         if speech_synthesis:
             # Queue only the latest request so the endpoint returns immediately.
-            success = speech_synthesis.speak_latest(text)
+            # The recognizer's own sentence (letters and spaces) is already
+            # speakable and skips text cleaning.
+            raw = text == recognizer.recognized_text.strip() and text.replace(' ', '').isalpha()
+            success = speech_synthesis.speak_latest(text, raw=raw)
             if success:
                 logger.info(f"Text-to-speech for user {session['user_id']}: {text[:50]}...")
                 return jsonify({'success': True, 'message': 'Speech synthesis started'})
@@ -421,7 +444,9 @@ def profile():
         session.clear()
         return redirect(url_for('login'))
     
-    # Add some statistics with correct field mappings
+    # Add some statistics with correct field mappings (on a copy - the
+    # auth module caches and shares the returned dict)
+    user_info = dict(user_info)
     user_info['join_date'] = user_info.get('created_at', 'Unknown')
     user_info['recognition_sessions'] = user_info.get('session_count', 0)
     user_info['total_recognition_time'] = user_info.get('total_recognition_time', 0)
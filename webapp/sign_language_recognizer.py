@@ -16,35 +16,327 @@ Key Features:
 import cv2
 import numpy as np
 import math
+import functools
+import time
 from keras.models import load_model
 from cvzone.HandTrackingModule import HandDetector
 from string import ascii_uppercase
 import enchant
 import os
 import logging
+from bisect import bisect_left
+
+try:
+    import onnxruntime as ort
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+except ImportError:
+    ort = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 logger = logging.getLogger(__name__)
 
+# Skeleton segments drawn on the model input: finger lines, then palm connections
+_SKELETON_SEGMENTS = np.array([
+    (0, 4), (5, 8), (9, 12), (13, 16), (17, 20),
+    (5, 9), (9, 13), (13, 17), (0, 5), (0, 17)
+])
+
+# Codes kept in the ten_prev_char ring: blank, A-Z, the two commands, then
+# the non-letter predictions; anything else is recorded as '-'
+_RING_CHARS = [" "] + list(ascii_uppercase) + ["next", "Backspace", "-", "MODEL_ERROR", "PRED_ERROR"]
+_RING_CODES = {char: code for code, char in enumerate(_RING_CHARS)}
+_CODE_BLANK = _RING_CODES[" "]
+_CODE_NEXT = _RING_CODES["next"]
+_CODE_BACKSPACE = _RING_CODES["Backspace"]
+_CODE_DASH = _RING_CODES["-"]
+
+# Rule kernel codes for the two multi-character predictions
+_NEXT = -1
+_BACKSPACE = -2
+
+
+def _jit(func):
+    """Compile func with Numba in nopython mode, or return it unchanged without Numba"""
+    return njit(cache=True)(func) if njit is not None else func
+
+
+@_jit
+def _sq_dist(pts, a, b):
+    """Squared distance between landmarks a and b"""
+    dx = pts[a][0] - pts[b][0]
+    dy = pts[a][1] - pts[b][1]
+    return dx * dx + dy * dy
+
+
+@_jit
+def _rules_kernel(ch1, ch2, pts):
+    """
+    Gesture rules on the 21 hand landmarks, compiled with Numba when it is installed
+
+    Args:
+        ch1: Top CNN group
+        ch2: Second CNN group
+        pts: C-contiguous int32 array of shape (21, 2) with landmark (x, y),
+             or the equivalent nested list when Numba is unavailable
+
+    Returns:
+        ord() of the predicted letter, space or '-', or _NEXT / _BACKSPACE
+    """
+    # Finger and distance tests shared by many rules, computed once
+    i_up = pts[6][1] > pts[8][1]
+    m_up = pts[10][1] > pts[12][1]
+    r_up = pts[14][1] > pts[16][1]
+    p_up = pts[18][1] > pts[20][1]
+    i_dn = pts[6][1] < pts[8][1]
+    m_dn = pts[10][1] < pts[12][1]
+    r_dn = pts[14][1] < pts[16][1]
+    p_dn = pts[18][1] < pts[20][1]
+    wrist_right_of_tips = (pts[0][0] > pts[8][0] and pts[0][0] > pts[12][0] and
+                           pts[0][0] > pts[16][0] and pts[0][0] > pts[20][0])
+    wrist_left_of_tips = (pts[0][0] < pts[8][0] and pts[0][0] < pts[12][0] and
+                          pts[0][0] < pts[16][0] and pts[0][0] < pts[20][0])
+    # Squared distances: every rule compares against a constant, so the
+    # thresholds below are squared instead of taking square roots
+    sq_8_16 = _sq_dist(pts, 8, 16)
+    sq_4_11 = _sq_dist(pts, 4, 11)
+    sq_12_4 = _sq_dist(pts, 12, 4)
+    sq_8_12 = _sq_dist(pts, 8, 12)
+    sq_8_4 = _sq_dist(pts, 8, 4)
+    sq_6_10 = _sq_dist(pts, 6, 10)
+
+    # 8-group remapping rules ported from the original predictor.
+    if (ch1, ch2) in ((5, 2), (5, 3), (3, 5), (3, 6), (3, 0), (3, 2), (6, 4), (6, 1), (6, 2), (6, 6), (6, 7), (6, 0), (6, 5),
+                      (4, 1), (1, 0), (1, 1), (6, 3), (1, 6), (5, 6), (5, 1), (4, 5), (1, 4), (1, 5), (2, 0), (2, 6), (4, 6),
+                      (5, 7), (7, 6), (2, 5), (7, 1), (5, 4), (7, 0), (7, 5), (7, 2)):
+        if i_dn and m_dn and r_dn and p_dn:
+            ch1 = 0
+
+    if (ch1, ch2) in ((2, 2), (2, 1)) and pts[5][0] < pts[4][0]:
+        ch1 = 0
+
+    if (ch1, ch2) in ((0, 0), (0, 6), (0, 2), (0, 5), (0, 1), (0, 7), (5, 2), (7, 6), (7, 1)):
+        if wrist_right_of_tips and pts[0][0] > pts[4][0] and pts[5][0] > pts[4][0]:
+            ch1 = 2
+
+    if (ch1, ch2) in ((6, 0), (6, 6), (6, 2)) and sq_8_16 < 2704:
+        ch1 = 2
+
+    if (ch1, ch2) in ((1, 4), (1, 5), (1, 6), (1, 3), (1, 0)):
+        if i_up and r_dn and p_dn and wrist_left_of_tips:
+            ch1 = 3
+
+    if (ch1, ch2) in ((4, 6), (4, 1), (4, 5), (4, 3), (4, 7)) and pts[4][0] > pts[0][0]:
+        ch1 = 3
+
+    if (ch1, ch2) in ((5, 3), (5, 0), (5, 7), (5, 4), (5, 2), (5, 1), (5, 5)) and pts[2][1] + 15 < pts[16][1]:
+        ch1 = 3
+
+    if (ch1, ch2) in ((6, 4), (6, 1), (6, 2)) and sq_4_11 > 3025:
+        ch1 = 4
+
+    if (ch1, ch2) in ((1, 4), (1, 6), (1, 1)):
+        if sq_4_11 > 2500 and (i_up and m_dn and r_dn and p_dn):
+            ch1 = 4
+
+    if (ch1, ch2) in ((3, 6), (3, 4)) and pts[4][0] < pts[0][0]:
+        ch1 = 4
+
+    if (ch1, ch2) in ((2, 2), (2, 5), (2, 4)) and pts[1][0] < pts[12][0]:
+        ch1 = 4
+
+    if (ch1, ch2) in ((3, 6), (3, 5), (3, 4)):
+        if (i_up and m_dn and r_dn and p_dn) and pts[4][1] > pts[10][1]:
+            ch1 = 5
+
+    if (ch1, ch2) in ((3, 2), (3, 1), (3, 6)) and (pts[4][1] + 17 > pts[8][1] and pts[4][1] + 17 > pts[12][1] and
+                                                       pts[4][1] + 17 > pts[16][1] and pts[4][1] + 17 > pts[20][1]):
+        ch1 = 5
+
+    if (ch1, ch2) in ((4, 4), (4, 5), (4, 2), (7, 5), (7, 6), (7, 0)) and pts[4][0] > pts[0][0]:
+        ch1 = 5
+
+    if (ch1, ch2) in ((0, 2), (0, 6), (0, 1), (0, 5), (0, 0), (0, 7), (0, 4), (0, 3), (2, 7)) and wrist_left_of_tips:
+        ch1 = 5
+
+    if (ch1, ch2) in ((5, 7), (5, 2), (5, 6)) and pts[3][0] < pts[0][0]:
+        ch1 = 7
+
+    if (ch1, ch2) in ((4, 6), (4, 2), (4, 4), (4, 1), (4, 5), (4, 7)) and i_dn:
+        ch1 = 7
+
+    if (ch1, ch2) in ((6, 7), (0, 7), (0, 1), (0, 0), (6, 4), (6, 6), (6, 5), (6, 1)) and p_up:
+        ch1 = 7
+
+    if (ch1, ch2) in ((0, 4), (0, 2), (0, 3), (0, 1), (0, 6)) and pts[5][0] > pts[16][0]:
+        ch1 = 6
+
+    if (ch1, ch2) == (7, 2) and p_dn:
+        ch1 = 6
+
+    if (ch1, ch2) in ((2, 1), (2, 2), (2, 6), (2, 7), (2, 0)) and sq_8_16 > 2500:
+        ch1 = 6
+
+    if (ch1, ch2) in ((4, 6), (4, 2), (4, 1), (4, 4)) and sq_4_11 < 3600:
+        ch1 = 6
+
+    if (ch1, ch2) in ((1, 4), (1, 6), (1, 0), (1, 2)) and (pts[5][0] - pts[4][0] - 15 > 0):
+        ch1 = 6
+
+    if (ch1, ch2) in ((5, 0), (5, 1), (5, 4), (5, 5), (5, 6), (6, 1), (7, 6), (0, 2), (7, 1), (7, 4), (6, 6), (7, 2), (6, 3),
+                      (6, 4), (7, 5)):
+        if i_up and m_up and r_up and p_up:
+            ch1 = 1
+
+    if (ch1, ch2) in ((6, 1), (6, 0), (0, 3), (6, 4), (2, 2), (0, 6), (6, 2), (7, 6), (4, 6), (4, 1), (4, 2), (0, 2), (7, 1),
+                      (7, 4), (6, 6), (7, 2), (7, 5)):
+        if i_dn and m_up and r_up and p_up:
+            ch1 = 1
+
+    if (ch1, ch2) in ((6, 1), (6, 0), (4, 2), (4, 1), (4, 6), (4, 4)) and (m_up and r_up and p_up):
+        ch1 = 1
+
+    if (ch1, ch2) in ((5, 0), (3, 4), (3, 0), (3, 1), (3, 5), (5, 5), (5, 4), (5, 1), (7, 6)):
+        if (i_up and m_dn and r_dn and p_dn) and (pts[2][0] < pts[0][0]) and pts[4][1] > pts[14][1]:
+            ch1 = 1
+
+    if (ch1, ch2) in ((4, 1), (4, 2), (4, 4)):
+        if sq_4_11 < 2500 and (i_up and m_dn and r_dn and p_dn):
+            ch1 = 1
+
+    if (ch1, ch2) in ((3, 4), (3, 0), (3, 1), (3, 5), (3, 6)):
+        if (i_up and m_dn and r_dn and p_dn) and (pts[2][0] < pts[0][0]) and pts[14][1] < pts[4][1]:
+            ch1 = 1
+
+    if (ch1, ch2) in ((6, 6), (6, 4), (6, 1), (6, 2)) and (pts[5][0] - pts[4][0] - 15 < 0):
+        ch1 = 1
+
+    if (ch1, ch2) in ((5, 4), (5, 5), (5, 1), (0, 3), (0, 7), (5, 0), (0, 2), (6, 2), (7, 5), (7, 1), (7, 6), (7, 7)):
+        if i_dn and m_dn and r_dn and p_up:
+            ch1 = 1
+
+    if (ch1, ch2) in ((1, 5), (1, 7), (1, 1), (1, 6), (1, 3), (1, 0)):
+        if (pts[4][0] < pts[5][0] + 15) and (i_dn and m_dn and r_dn and p_up):
+            ch1 = 7
+
+    if (ch1, ch2) in ((5, 5), (5, 0), (5, 4), (5, 1), (4, 6), (4, 1), (7, 6), (3, 0), (3, 5)):
+        if (i_up and m_up and r_dn and p_dn) and pts[4][1] > pts[14][1]:
+            ch1 = 1
+
+    fg = 13
+    if (ch1, ch2) in ((3, 5), (3, 0), (3, 6), (5, 1), (4, 1), (2, 0), (5, 0), (5, 5)):
+        left_cluster = (pts[0][0] + fg < pts[8][0] and pts[0][0] + fg < pts[12][0] and
+                        pts[0][0] + fg < pts[16][0] and pts[0][0] + fg < pts[20][0])
+        if (not left_cluster) and (not wrist_right_of_tips) and sq_4_11 < 2500:
+            ch1 = 1
+
+    if (ch1, ch2) in ((5, 0), (5, 5), (0, 1)) and (i_up and m_up and r_up):
+        ch1 = 1
+
+    # Subgroup mapping
+    predicted_char = ord('-')
+    if ch1 == 0:
+        predicted_char = ord('S')
+        if pts[4][0] < pts[6][0] and pts[4][0] < pts[10][0] and pts[4][0] < pts[14][0] and pts[4][0] < pts[18][0]:
+            predicted_char = ord('A')
+        if pts[4][0] > pts[6][0] and pts[4][0] < pts[10][0] and pts[4][0] < pts[14][0] and pts[4][0] < pts[18][0] and pts[4][1] < pts[14][1] and pts[4][1] < pts[18][1]:
+            predicted_char = ord('T')
+        if pts[4][1] > pts[8][1] and pts[4][1] > pts[12][1] and pts[4][1] > pts[16][1] and pts[4][1] > pts[20][1]:
+            predicted_char = ord('E')
+        if pts[4][0] > pts[6][0] and pts[4][0] > pts[10][0] and pts[4][0] > pts[14][0] and pts[4][1] < pts[18][1]:
+            predicted_char = ord('M')
+        if pts[4][0] > pts[6][0] and pts[4][0] > pts[10][0] and pts[4][1] < pts[18][1] and pts[4][1] < pts[14][1]:
+            predicted_char = ord('N')
+
+    elif ch1 == 2:
+        predicted_char = ord('C') if sq_12_4 > 1764 else ord('O')
+    elif ch1 == 3:
+        predicted_char = ord('G') if sq_8_12 > 5184 else ord('H')
+    elif ch1 == 4:
+        predicted_char = ord('L')
+    elif ch1 == 5:
+        if pts[4][0] > pts[12][0] and pts[4][0] > pts[16][0] and pts[4][0] > pts[20][0]:
+            predicted_char = ord('Z') if pts[8][1] < pts[5][1] else ord('Q')
+        else:
+            predicted_char = ord('P')
+    elif ch1 == 6:
+        predicted_char = ord('X')
+    elif ch1 == 7:
+        predicted_char = ord('Y') if sq_8_4 > 1764 else ord('J')
+    elif ch1 == 1:
+        if i_up and m_up and r_up and p_up:
+            predicted_char = ord('B')
+        if i_up and m_dn and r_dn and p_dn:
+            predicted_char = ord('D')
+        if i_dn and m_up and r_up and p_up:
+            predicted_char = ord('F')
+        if i_dn and m_dn and r_dn and p_up:
+            predicted_char = ord('I')
+        if i_up and m_up and r_up and p_dn:
+            predicted_char = ord('W')
+        if (i_up and m_up and r_dn and p_dn) and pts[4][1] < pts[9][1]:
+            predicted_char = ord('K')
+        # U/V compare a difference of distances, which needs the real roots
+        spread = math.sqrt(sq_8_12) - math.sqrt(sq_6_10)
+        if (spread < 8) and (i_up and m_up and r_dn and p_dn):
+            predicted_char = ord('U')
+        if (spread >= 8) and (i_up and m_up and r_dn and p_dn) and (pts[4][1] > pts[9][1]):
+            predicted_char = ord('V')
+        if (pts[8][0] > pts[12][0]) and (i_up and m_up and r_dn and p_dn):
+            predicted_char = ord('R')
+
+    if predicted_char in (ord('B'), ord('E'), ord('S'), ord('X'), ord('Y')):
+        if i_up and m_dn and r_dn and p_up:
+            predicted_char = ord(' ')
+
+    if predicted_char in (ord('E'), ord('Y'), ord('B')) and pts[4][0] < pts[5][0]:
+        predicted_char = _NEXT
+
+    if predicted_char in (_NEXT, ord('B'), ord('C'), ord('H'), ord('F')):
+        if wrist_right_of_tips and (pts[4][1] < pts[8][1] and pts[4][1] < pts[12][1] and
+                                    pts[4][1] < pts[16][1] and pts[4][1] < pts[20][1]):
+            predicted_char = _BACKSPACE
+
+    return predicted_char
+
+
 class SignLanguageRecognizer:
-    def __init__(self, model_path='cnn8grps_rad1_model.h5', white_bg_path='white.jpg'):
+    def __init__(self, model_path='cnn8grps_rad1_model.h5', white_bg_path='white.jpg',
+                 words_path='/usr/share/dict/words', onnx_precision='int8'):
         """
         Initialize the Sign Language Recognizer
         
         Args:
             model_path: Path to the trained CNN model
             white_bg_path: Path to white background image for hand skeleton
+            words_path: Path to a newline-separated word list for prefix suggestions
+            onnx_precision: ONNX Runtime model precision: 'int8', 'fp16' or 'fp32'
         """
         self.model_path = model_path
         self.white_bg_path = white_bg_path
+        self.words_path = words_path
+        self.onnx_precision = onnx_precision
         
-        # Initialize hand detectors
+        # Initialize hand detector
         self.hd = HandDetector(maxHands=1)
-        self.hd2 = HandDetector(maxHands=1)
         
         # Load CNN model
         self.model = None
+        self.session = None
+        self.input_name = None
         self.load_model()
         
+        # Reusable float32 model input batch, filled in place for every prediction
+        self._model_input = np.empty((1, 400, 400, 3), dtype=np.float32)
+        
+        # Load the skeleton background once instead of on every frame. The
+        # skeleton is drawn straight into the model input, so keep a float32 copy
+        self.white_template = self.load_white_background()
+        self.white_template_f32 = self.white_template.astype(np.float32)
+        
         # Initialize dictionary for word suggestions
         try:
             self.dictionary = enchant.Dict("en-US")
@@ -52,29 +344,186 @@ class SignLanguageRecognizer:
             logger.warning(f"Could not load dictionary: {e}")
             self.dictionary = None
         
+        # Sorted uppercase word list for prefix completion, with suggestions
+        # cached per prefix since the same words are spelled over and over
+        self.word_list = self.load_word_list()
+        self._cached_suggestions = functools.lru_cache(maxsize=1024)(self.lookup_suggestions)
+        
         # Recognition state variables
         self.reset_recognition_state()
         
         # Constants
         self.offset = 29
+        self.min_roi_size = 20
+        
+        # Reuse the last CNN group while the hand barely moves (summed |dx|+|dy|
+        # over all 21 landmarks), refreshing at least every few frames
+        self.cnn_reuse_motion = 42
+        self.cnn_max_reuse = 4
+        
+        # Minimum seconds between word suggestion refreshes
+        self.suggestion_interval = 0.1
+        
+        # Compile the rule kernel now rather than on the first detected hand
+        _rules_kernel(0, 0, np.zeros((21, 2), dtype=np.int32) if njit is not None else [[0, 0]] * 21)
         
+    def resolve_asset_path(self, path):
+        """
+        Resolve an asset path, looking in the parent directory as a fallback
+        
+        Args:
+            path: Asset path as configured
+            
+        Returns:
+            Existing path, or None if the asset is in neither location
+        """
+        for candidate in (path, os.path.join('..', path)):
+            if os.path.exists(candidate):
+                return candidate
+        return None
+    
     def load_model(self):
         """Load the pre-trained CNN model"""
         try:
-            if os.path.exists(self.model_path):
-                self.model = load_model(self.model_path)
-                logger.info(f"Model loaded successfully from {self.model_path}")
-            else:
-                # Try to find model in parent directory
-                parent_model_path = os.path.join('..', self.model_path)
-                if os.path.exists(parent_model_path):
-                    self.model = load_model(parent_model_path)
-                    logger.info(f"Model loaded from parent directory: {parent_model_path}")
-                else:
-                    raise FileNotFoundError(f"Model file not found: {self.model_path}")
+            model_file = self.resolve_asset_path(self.model_path)
+            if model_file is None:
+                raise FileNotFoundError(f"Model file not found: {self.model_path}")
+            self.model = load_model(model_file)
+            logger.info(f"Model loaded successfully from {model_file}")
         except Exception as e:
             logger.error(f"Error loading model: {e}")
             raise
+        
+        # Prefer ONNX Runtime for per-frame inference, keep Keras as fallback
+        if ort is not None:
+            try:
+                self.load_onnx_session(model_file)
+            except Exception as e:
+                logger.warning(f"ONNX Runtime session unavailable, using Keras: {e}")
+                self.session = None
+    
+    def load_onnx_session(self, model_file):
+        """
+        Load an ONNX copy of the Keras model at the configured precision
+        
+        'int8' dynamically quantizes the weights to uint8 (ONNX Runtime's CPU
+        provider has no ConvInteger kernel for int8 weights), 'fp16' halves
+        weights and activations (inputs and outputs stay float32), 'fp32' runs
+        the plain export. The export and conversion run once and are cached next to the
+        .h5 file; they are rebuilt only when the .h5 is newer than the cache.
+        
+        Args:
+            model_file: Resolved path to the Keras .h5 model
+        """
+        if self.onnx_precision not in ('int8', 'fp16', 'fp32'):
+            raise ValueError(f"Unsupported ONNX precision: {self.onnx_precision}")
+        
+        base_path = os.path.splitext(model_file)[0]
+        onnx_path = base_path + '.onnx'
+        model_mtime = os.path.getmtime(model_file)
+        if self.onnx_precision == 'fp32':
+            session_path = onnx_path
+        elif self.onnx_precision == 'int8':
+            # Distinct name so caches quantized with int8 weights are never loaded
+            session_path = f"{base_path}_uint8.onnx"
+        else:
+            session_path = f"{base_path}_{self.onnx_precision}.onnx"
+        
+        def is_stale(path):
+            return not os.path.exists(path) or os.path.getmtime(path) < model_mtime
+        
+        if is_stale(session_path):
+            if is_stale(onnx_path):
+                import tensorflow as tf
+                import tf2onnx
+                
+                spec = (tf.TensorSpec((None, 400, 400, 3), tf.float32, name='input'),)
+                tf2onnx.convert.from_keras(self.model, input_signature=spec, opset=13,
+                                           output_path=onnx_path)
+                logger.info(f"Exported ONNX model to {onnx_path}")
+            if self.onnx_precision == 'int8':
+                quantize_dynamic(onnx_path, session_path, weight_type=QuantType.QUInt8)
+                logger.info(f"Quantized ONNX model to {session_path}")
+            elif self.onnx_precision == 'fp16':
+                import onnx
+                from onnxruntime.transformers.float16 import convert_float_to_float16
+                
+                fp16_model = convert_float_to_float16(onnx.load(onnx_path), keep_io_types=True)
+                onnx.save(fp16_model, session_path)
+                logger.info(f"Converted ONNX model to FP16 at {session_path}")
+        
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.intra_op_num_threads = min(4, os.cpu_count() or 1)
+        self.session = ort.InferenceSession(session_path, sess_options=options,
+                                            providers=['CPUExecutionProvider'])
+        self.input_name = self.session.get_inputs()[0].name
+        logger.info(f"ONNX Runtime session loaded from {session_path}")
+    
+    def run_model(self, input_image):
+        """
+        Run the CNN on a single (1, 400, 400, 3) batch
+        
+        Args:
+            input_image: Model input batch
+            
+        Returns:
+            Class probabilities for the batch item
+        """
+        if self.session is not None:
+            return self.session.run(None, {self.input_name: input_image.astype(np.float32, copy=False)})[0][0]
+        return self.model.predict(input_image)[0]
+    
+    def load_white_background(self):
+        """
+        Load the white background image used for hand skeleton drawing
+        
+        Returns:
+            400x400x3 uint8 image, plain white if the file cannot be read
+        """
+        try:
+            white_path = self.resolve_asset_path(self.white_bg_path)
+            if white_path is not None:
+                white = cv2.imread(white_path)
+                if white is not None:
+                    return white
+            logger.warning(f"White background not found: {self.white_bg_path}, using blank image")
+        except Exception as e:
+            logger.warning(f"Error loading white background: {e}")
+        
+        # Create white background if file not found
+        return np.full((400, 400, 3), 255, dtype=np.uint8)
+    
+    def load_word_list(self):
+        """
+        Load the word list used for prefix suggestions
+        
+        Returns:
+            Sorted list of unique uppercase words, empty if the file cannot be read
+        """
+        try:
+            with open(self.words_path, encoding='utf-8', errors='ignore') as f:
+                words = sorted({line.strip().upper() for line in f if line.strip().isalpha()})
+            logger.info(f"Loaded {len(words)} words for suggestions from {self.words_path}")
+            return words
+        except OSError as e:
+            logger.warning(f"Could not load word list: {e}")
+            return []
+    
+    def prefix_suggestions(self, prefix, limit=4):
+        """
+        Find words starting with prefix by binary search over the sorted word list
+        
+        Args:
+            prefix: Word prefix to complete
+            limit: Maximum number of words to return
+            
+        Returns:
+            Up to limit uppercase words, in alphabetical order
+        """
+        prefix = prefix.upper()
+        start = bisect_left(self.word_list, prefix)
+        return [word for word in self.word_list[start:start + limit] if word.startswith(prefix)]
     
     def reset_recognition_state(self):
         """Reset all recognition state variables"""
@@ -85,7 +534,7 @@ class SignLanguageRecognizer:
         self.next_flag = True
         self.prev_char = ""
         self.count = -1
-        self.ten_prev_char = [" "] * 10
+        self.ten_prev_char = np.zeros(10, dtype=np.int8)
         
         # Initialize character counters
         for i in ascii_uppercase:
@@ -98,20 +547,23 @@ class SignLanguageRecognizer:
         
         # Word suggestions
         self.word_suggestions = [" ", " ", " ", " "]
+        self._last_prefix = None
+        self._last_suggestion_time = 0.0
+        
+        # Last CNN prediction and the landmarks it was made for
+        self.last_cnn_groups = None
+        self.last_cnn_landmarks = None
+        self.cnn_reuse_count = 0
         
         logger.info("Recognition state reset")
     
-    def distance(self, point1, point2):
-        """Calculate Euclidean distance between two points"""
-        return math.sqrt((point1[0] - point2[0])**2 + (point1[1] - point2[1])**2)
-    
     def draw_hand_skeleton(self, white_bg, landmarks, bbox):
         """
         Draw hand skeleton on white background
         
         Args:
             white_bg: White background image
-            landmarks: Hand landmarks from MediaPipe
+            landmarks: (21, 3) int32 hand landmarks, bbox-relative
             bbox: Bounding box [x, y, w, h]
             
         Returns:
@@ -121,21 +573,15 @@ class SignLanguageRecognizer:
         os_x = ((400 - w) // 2) - 15
         os_y = ((400 - h) // 2) - 15
         
-        # Draw finger connections
-        connections = [
-            (0, 4), (5, 8), (9, 12), (13, 16), (17, 20),  # Finger lines
-            (5, 9), (9, 13), (13, 17), (0, 5), (0, 17)    # Palm connections
-        ]
+        # Shift all landmarks onto the canvas in one step
+        points = np.asarray(landmarks, dtype=np.int32)[:, :2] + np.array([os_x, os_y], dtype=np.int32)
         
-        for start_idx, end_idx in connections:
-            if start_idx < len(landmarks) and end_idx < len(landmarks):
-                start_point = (landmarks[start_idx][0] + os_x, landmarks[start_idx][1] + os_y)
-                end_point = (landmarks[end_idx][0] + os_x, landmarks[end_idx][1] + os_y)
-                cv2.line(white_bg, start_point, end_point, (0, 255, 0), 3)
+        # Draw all finger and palm connections with a single polylines call
+        cv2.polylines(white_bg, list(points[_SKELETON_SEGMENTS]), False, (0, 255, 0), 3)
         
         # Draw landmark points
-        for point in landmarks:
-            cv2.circle(white_bg, (point[0] + os_x, point[1] + os_y), 2, (0, 0, 255), 1)
+        for point in points.tolist():
+            cv2.circle(white_bg, tuple(point), 2, (0, 0, 255), 1)
             
         return white_bg
     
@@ -154,19 +600,30 @@ class SignLanguageRecognizer:
             return 'MODEL_ERROR'
             
         try:
-            # Prepare image for model prediction
-            input_image = hand_image.reshape(1, 400, 400, 3)
+            hand_points = np.asarray(landmarks, dtype=np.int32)[:, :2]
             
-            # Get model predictions
-            prob = np.array(self.model.predict(input_image)[0], dtype='float32')
-            ch1 = np.argmax(prob, axis=0)
-            prob[ch1] = 0
-            ch2 = np.argmax(prob, axis=0)
-            prob[ch2] = 0
-            ch3 = np.argmax(prob, axis=0)
-            prob[ch3] = 0
-            
-            pl = [ch1, ch2]
+            if self.can_reuse_cnn_groups(hand_points):
+                # Hand is nearly static: the landmark rules below still run on
+                # the fresh landmarks, only the CNN group guess is reused
+                ch1, ch2 = self.last_cnn_groups
+                self.cnn_reuse_count += 1
+            else:
+                # Prepare image for model prediction (process_frame already
+                # draws into the model input buffer)
+                if not np.may_share_memory(hand_image, self._model_input):
+                    np.copyto(self._model_input[0], hand_image, casting='unsafe')
+                
+                # Get model predictions
+                prob = np.asarray(self.run_model(self._model_input), dtype='float32')
+                # Only the two most likely groups are used; pick them without
+                # mutating the model output
+                top = np.argpartition(prob, -2)[-2:]
+                order = top[np.argsort(prob[top])[::-1]]
+                ch1, ch2 = int(order[0]), int(order[1])
+                
+                self.last_cnn_groups = (ch1, ch2)
+                self.last_cnn_landmarks = hand_points
+                self.cnn_reuse_count = 0
             
             # Apply complex gesture recognition logic (from original)
             predicted_char = self._apply_gesture_rules(ch1, ch2, landmarks)
@@ -177,272 +634,45 @@ class SignLanguageRecognizer:
             logger.error(f"Prediction error: {e}")
             return 'PRED_ERROR'
     
+    def can_reuse_cnn_groups(self, hand_points):
+        """
+        Check whether the previous CNN prediction still applies
+        
+        Args:
+            hand_points: (21, 2) landmark coordinates for the current frame
+            
+        Returns:
+            bool: True if the hand moved less than cnn_reuse_motion since the
+            last CNN run and the reuse budget is not exhausted
+        """
+        if self.last_cnn_groups is None or self.cnn_reuse_count >= self.cnn_max_reuse:
+            return False
+        if self.last_cnn_landmarks.shape != hand_points.shape:
+            return False
+        motion = np.abs(hand_points - self.last_cnn_landmarks).sum()
+        return motion < self.cnn_reuse_motion
+    
     def _apply_gesture_rules(self, ch1, ch2, landmarks):
         """
         Apply the complex gesture recognition rules from the original system
         This is the exact logic from the original predict() method
         """
-        pts = landmarks  # For compatibility with original code
-        if not isinstance(pts, (list, tuple)) or len(pts) < 21:
+        try:
+            pts = np.ascontiguousarray(np.asarray(landmarks, dtype=np.int32)[:21, :2])
+        except (TypeError, ValueError, IndexError):
             return "-"
-        ch1 = int(ch1)
-        ch2 = int(ch2)
-
-        # 8-group remapping rules ported from the original predictor.
-        pl = [ch1, ch2]
-
-        l = [[5, 2], [5, 3], [3, 5], [3, 6], [3, 0], [3, 2], [6, 4], [6, 1], [6, 2], [6, 6], [6, 7], [6, 0], [6, 5],
-             [4, 1], [1, 0], [1, 1], [6, 3], [1, 6], [5, 6], [5, 1], [4, 5], [1, 4], [1, 5], [2, 0], [2, 6], [4, 6],
-             [1, 0], [5, 7], [1, 6], [6, 1], [7, 6], [2, 5], [7, 1], [5, 4], [7, 0], [7, 5], [7, 2]]
-        if pl in l and (pts[6][1] < pts[8][1] and pts[10][1] < pts[12][1] and pts[14][1] < pts[16][1] and pts[18][1] < pts[20][1]):
-            ch1 = 0
-
-        l = [[2, 2], [2, 1]]
-        if pl in l and pts[5][0] < pts[4][0]:
-            ch1 = 0
-
-        l = [[0, 0], [0, 6], [0, 2], [0, 5], [0, 1], [0, 7], [5, 2], [7, 6], [7, 1]]
-        pl = [ch1, ch2]
-        if pl in l:
-            if (pts[0][0] > pts[8][0] and pts[0][0] > pts[4][0] and pts[0][0] > pts[12][0] and pts[0][0] > pts[16][0] and pts[0][0] > pts[20][0]) and pts[5][0] > pts[4][0]:
-                ch1 = 2
-
-        l = [[6, 0], [6, 6], [6, 2]]
-        pl = [ch1, ch2]
-        if pl in l and self.distance(pts[8], pts[16]) < 52:
-            ch1 = 2
-
-        l = [[1, 4], [1, 5], [1, 6], [1, 3], [1, 0]]
-        pl = [ch1, ch2]
-        if pl in l:
-            if pts[6][1] > pts[8][1] and pts[14][1] < pts[16][1] and pts[18][1] < pts[20][1] and pts[0][0] < pts[8][0] and pts[0][0] < pts[12][0] and pts[0][0] < pts[16][0] and pts[0][0] < pts[20][0]:
-                ch1 = 3
-
-        l = [[4, 6], [4, 1], [4, 5], [4, 3], [4, 7]]
-        pl = [ch1, ch2]
-        if pl in l and pts[4][0] > pts[0][0]:
-            ch1 = 3
-
-        l = [[5, 3], [5, 0], [5, 7], [5, 4], [5, 2], [5, 1], [5, 5]]
-        pl = [ch1, ch2]
-        if pl in l and pts[2][1] + 15 < pts[16][1]:
-            ch1 = 3
-
-        l = [[6, 4], [6, 1], [6, 2]]
-        pl = [ch1, ch2]
-        if pl in l and self.distance(pts[4], pts[11]) > 55:
-            ch1 = 4
-
-        l = [[1, 4], [1, 6], [1, 1]]
-        pl = [ch1, ch2]
-        if pl in l:
-            if (self.distance(pts[4], pts[11]) > 50) and (pts[6][1] > pts[8][1] and pts[10][1] < pts[12][1] and pts[14][1] < pts[16][1] and pts[18][1] < pts[20][1]):
-                ch1 = 4
-
-        l = [[3, 6], [3, 4]]
-        pl = [ch1, ch2]
-        if pl in l and pts[4][0] < pts[0][0]:
-            ch1 = 4
-
-        l = [[2, 2], [2, 5], [2, 4]]
-        pl = [ch1, ch2]
-        if pl in l and pts[1][0] < pts[12][0]:
-            ch1 = 4
-
-        l = [[3, 6], [3, 5], [3, 4]]
-        pl = [ch1, ch2]
-        if pl in l:
-            if (pts[6][1] > pts[8][1] and pts[10][1] < pts[12][1] and pts[14][1] < pts[16][1] and pts[18][1] < pts[20][1]) and pts[4][1] > pts[10][1]:
-                ch1 = 5
-
-        l = [[3, 2], [3, 1], [3, 6]]
-        pl = [ch1, ch2]
-        if pl in l and (pts[4][1] + 17 > pts[8][1] and pts[4][1] + 17 > pts[12][1] and pts[4][1] + 17 > pts[16][1] and pts[4][1] + 17 > pts[20][1]):
-            ch1 = 5
-
-        l = [[4, 4], [4, 5], [4, 2], [7, 5], [7, 6], [7, 0]]
-        pl = [ch1, ch2]
-        if pl in l and pts[4][0] > pts[0][0]:
-            ch1 = 5
-
-        l = [[0, 2], [0, 6], [0, 1], [0, 5], [0, 0], [0, 7], [0, 4], [0, 3], [2, 7]]
-        pl = [ch1, ch2]
-        if pl in l and (pts[0][0] < pts[8][0] and pts[0][0] < pts[12][0] and pts[0][0] < pts[16][0] and pts[0][0] < pts[20][0]):
-            ch1 = 5
-
-        l = [[5, 7], [5, 2], [5, 6]]
-        pl = [ch1, ch2]
-        if pl in l and pts[3][0] < pts[0][0]:
-            ch1 = 7
-
-        l = [[4, 6], [4, 2], [4, 4], [4, 1], [4, 5], [4, 7]]
-        pl = [ch1, ch2]
-        if pl in l and pts[6][1] < pts[8][1]:
-            ch1 = 7
-
-        l = [[6, 7], [0, 7], [0, 1], [0, 0], [6, 4], [6, 6], [6, 5], [6, 1]]
-        pl = [ch1, ch2]
-        if pl in l and pts[18][1] > pts[20][1]:
-            ch1 = 7
-
-        l = [[0, 4], [0, 2], [0, 3], [0, 1], [0, 6]]
-        pl = [ch1, ch2]
-        if pl in l and pts[5][0] > pts[16][0]:
-            ch1 = 6
-
-        l = [[7, 2]]
-        pl = [ch1, ch2]
-        if pl in l and pts[18][1] < pts[20][1]:
-            ch1 = 6
-
-        l = [[2, 1], [2, 2], [2, 6], [2, 7], [2, 0]]
-        pl = [ch1, ch2]
-        if pl in l and self.distance(pts[8], pts[16]) > 50:
-            ch1 = 6
-
-        l = [[4, 6], [4, 2], [4, 1], [4, 4]]
-        pl = [ch1, ch2]
-        if pl in l and self.distance(pts[4], pts[11]) < 60:
-            ch1 = 6
-
-        l = [[1, 4], [1, 6], [1, 0], [1, 2]]
-        pl = [ch1, ch2]
-        if pl in l and (pts[5][0] - pts[4][0] - 15 > 0):
-            ch1 = 6
-
-        l = [[5, 0], [5, 1], [5, 4], [5, 5], [5, 6], [6, 1], [7, 6], [0, 2], [7, 1], [7, 4], [6, 6], [7, 2], [5, 0], [6, 3], [6, 4], [7, 5], [7, 2]]
-        pl = [ch1, ch2]
-        if pl in l and (pts[6][1] > pts[8][1] and pts[10][1] > pts[12][1] and pts[14][1] > pts[16][1] and pts[18][1] > pts[20][1]):
-            ch1 = 1
-
-        l = [[6, 1], [6, 0], [0, 3], [6, 4], [2, 2], [0, 6], [6, 2], [7, 6], [4, 6], [4, 1], [4, 2], [0, 2], [7, 1], [7, 4], [6, 6], [7, 2], [7, 5], [7, 2]]
-        pl = [ch1, ch2]
-        if pl in l:
-            if (pts[6][1] < pts[8][1] and pts[10][1] > pts[12][1] and pts[14][1] > pts[16][1] and pts[18][1] > pts[20][1]):
-                ch1 = 1
-
-        l = [[6, 1], [6, 0], [4, 2], [4, 1], [4, 6], [4, 4]]
-        pl = [ch1, ch2]
-        if pl in l and (pts[10][1] > pts[12][1] and pts[14][1] > pts[16][1] and pts[18][1] > pts[20][1]):
-            ch1 = 1
-
-        l = [[5, 0], [3, 4], [3, 0], [3, 1], [3, 5], [5, 5], [5, 4], [5, 1], [7, 6]]
-        pl = [ch1, ch2]
-        if pl in l:
-            if ((pts[6][1] > pts[8][1] and pts[10][1] < pts[12][1] and pts[14][1] < pts[16][1] and pts[18][1] < pts[20][1]) and (pts[2][0] < pts[0][0]) and pts[4][1] > pts[14][1]):
-                ch1 = 1
-
-        l = [[4, 1], [4, 2], [4, 4]]
-        pl = [ch1, ch2]
-        if pl in l:
-            if (self.distance(pts[4], pts[11]) < 50) and (pts[6][1] > pts[8][1] and pts[10][1] < pts[12][1] and pts[14][1] < pts[16][1] and pts[18][1] < pts[20][1]):
-                ch1 = 1
-
-        l = [[3, 4], [3, 0], [3, 1], [3, 5], [3, 6]]
-        pl = [ch1, ch2]
-        if pl in l:
-            if ((pts[6][1] > pts[8][1] and pts[10][1] < pts[12][1] and pts[14][1] < pts[16][1] and pts[18][1] < pts[20][1]) and (pts[2][0] < pts[0][0]) and pts[14][1] < pts[4][1]):
-                ch1 = 1
-
-        l = [[6, 6], [6, 4], [6, 1], [6, 2]]
-        pl = [ch1, ch2]
-        if pl in l and (pts[5][0] - pts[4][0] - 15 < 0):
-            ch1 = 1
-
-        l = [[5, 4], [5, 5], [5, 1], [0, 3], [0, 7], [5, 0], [0, 2], [6, 2], [7, 5], [7, 1], [7, 6], [7, 7]]
-        pl = [ch1, ch2]
-        if pl in l:
-            if (pts[6][1] < pts[8][1] and pts[10][1] < pts[12][1] and pts[14][1] < pts[16][1] and pts[18][1] > pts[20][1]):
-                ch1 = 1
-
-        l = [[1, 5], [1, 7], [1, 1], [1, 6], [1, 3], [1, 0]]
-        pl = [ch1, ch2]
-        if pl in l:
-            if (pts[4][0] < pts[5][0] + 15) and (pts[6][1] < pts[8][1] and pts[10][1] < pts[12][1] and pts[14][1] < pts[16][1] and pts[18][1] > pts[20][1]):
-                ch1 = 7
-
-        l = [[5, 5], [5, 0], [5, 4], [5, 1], [4, 6], [4, 1], [7, 6], [3, 0], [3, 5]]
-        pl = [ch1, ch2]
-        if pl in l:
-            if ((pts[6][1] > pts[8][1] and pts[10][1] > pts[12][1] and pts[14][1] < pts[16][1] and pts[18][1] < pts[20][1]) and pts[4][1] > pts[14][1]):
-                ch1 = 1
-
-        l = [[3, 5], [3, 0], [3, 6], [5, 1], [4, 1], [2, 0], [5, 0], [5, 5]]
-        pl = [ch1, ch2]
-        fg = 13
-        if pl in l:
-            left_cluster = (pts[0][0] + fg < pts[8][0] and pts[0][0] + fg < pts[12][0] and pts[0][0] + fg < pts[16][0] and pts[0][0] + fg < pts[20][0])
-            right_cluster = (pts[0][0] > pts[8][0] and pts[0][0] > pts[12][0] and pts[0][0] > pts[16][0] and pts[0][0] > pts[20][0])
-            if (not left_cluster) and (not right_cluster) and self.distance(pts[4], pts[11]) < 50:
-                ch1 = 1
-
-        l = [[5, 0], [5, 5], [0, 1]]
-        pl = [ch1, ch2]
-        if pl in l and (pts[6][1] > pts[8][1] and pts[10][1] > pts[12][1] and pts[14][1] > pts[16][1]):
-            ch1 = 1
-
-        # Subgroup mapping
-        predicted_char = "-"
-        if ch1 == 0:
-            predicted_char = 'S'
-            if pts[4][0] < pts[6][0] and pts[4][0] < pts[10][0] and pts[4][0] < pts[14][0] and pts[4][0] < pts[18][0]:
-                predicted_char = 'A'
-            if pts[4][0] > pts[6][0] and pts[4][0] < pts[10][0] and pts[4][0] < pts[14][0] and pts[4][0] < pts[18][0] and pts[4][1] < pts[14][1] and pts[4][1] < pts[18][1]:
-                predicted_char = 'T'
-            if pts[4][1] > pts[8][1] and pts[4][1] > pts[12][1] and pts[4][1] > pts[16][1] and pts[4][1] > pts[20][1]:
-                predicted_char = 'E'
-            if pts[4][0] > pts[6][0] and pts[4][0] > pts[10][0] and pts[4][0] > pts[14][0] and pts[4][1] < pts[18][1]:
-                predicted_char = 'M'
-            if pts[4][0] > pts[6][0] and pts[4][0] > pts[10][0] and pts[4][1] < pts[18][1] and pts[4][1] < pts[14][1]:
-                predicted_char = 'N'
-
-        elif ch1 == 2:
-            predicted_char = 'C' if self.distance(pts[12], pts[4]) > 42 else 'O'
-        elif ch1 == 3:
-            predicted_char = 'G' if self.distance(pts[8], pts[12]) > 72 else 'H'
-        elif ch1 == 4:
-            predicted_char = 'L'
-        elif ch1 == 5:
-            if pts[4][0] > pts[12][0] and pts[4][0] > pts[16][0] and pts[4][0] > pts[20][0]:
-                predicted_char = 'Z' if pts[8][1] < pts[5][1] else 'Q'
-            else:
-                predicted_char = 'P'
-        elif ch1 == 6:
-            predicted_char = 'X'
-        elif ch1 == 7:
-            predicted_char = 'Y' if self.distance(pts[8], pts[4]) > 42 else 'J'
-        elif ch1 == 1:
-            if pts[6][1] > pts[8][1] and pts[10][1] > pts[12][1] and pts[14][1] > pts[16][1] and pts[18][1] > pts[20][1]:
-                predicted_char = 'B'
-            if pts[6][1] > pts[8][1] and pts[10][1] < pts[12][1] and pts[14][1] < pts[16][1] and pts[18][1] < pts[20][1]:
-                predicted_char = 'D'
-            if pts[6][1] < pts[8][1] and pts[10][1] > pts[12][1] and pts[14][1] > pts[16][1] and pts[18][1] > pts[20][1]:
-                predicted_char = 'F'
-            if pts[6][1] < pts[8][1] and pts[10][1] < pts[12][1] and pts[14][1] < pts[16][1] and pts[18][1] > pts[20][1]:
-                predicted_char = 'I'
-            if pts[6][1] > pts[8][1] and pts[10][1] > pts[12][1] and pts[14][1] > pts[16][1] and pts[18][1] < pts[20][1]:
-                predicted_char = 'W'
-            if (pts[6][1] > pts[8][1] and pts[10][1] > pts[12][1] and pts[14][1] < pts[16][1] and pts[18][1] < pts[20][1]) and pts[4][1] < pts[9][1]:
-                predicted_char = 'K'
-            if ((self.distance(pts[8], pts[12]) - self.distance(pts[6], pts[10])) < 8) and (pts[6][1] > pts[8][1] and pts[10][1] > pts[12][1] and pts[14][1] < pts[16][1] and pts[18][1] < pts[20][1]):
-                predicted_char = 'U'
-            if ((self.distance(pts[8], pts[12]) - self.distance(pts[6], pts[10])) >= 8) and (pts[6][1] > pts[8][1] and pts[10][1] > pts[12][1] and pts[14][1] < pts[16][1] and pts[18][1] < pts[20][1]) and (pts[4][1] > pts[9][1]):
-                predicted_char = 'V'
-            if (pts[8][0] > pts[12][0]) and (pts[6][1] > pts[8][1] and pts[10][1] > pts[12][1] and pts[14][1] < pts[16][1] and pts[18][1] < pts[20][1]):
-                predicted_char = 'R'
-
-        if predicted_char in ['B', 'E', 'S', 'X', 'Y']:
-            if pts[6][1] > pts[8][1] and pts[10][1] < pts[12][1] and pts[14][1] < pts[16][1] and pts[18][1] > pts[20][1]:
-                predicted_char = ' '
-
-        if predicted_char in ['E', 'Y', 'B'] and pts[4][0] < pts[5][0]:
-            predicted_char = 'next'
-
-        if predicted_char in ['next', 'B', 'C', 'H', 'F']:
-            if (pts[0][0] > pts[8][0] and pts[0][0] > pts[12][0] and pts[0][0] > pts[16][0] and pts[0][0] > pts[20][0]) and pts[4][1] < pts[8][1] and pts[4][1] < pts[12][1] and pts[4][1] < pts[16][1] and pts[4][1] < pts[20][1]:
-                predicted_char = 'Backspace'
-
-        return predicted_char
+        if len(pts) < 21 or pts.shape[1] < 2:
+            return "-"
+        if njit is None:
+            # The interpreted kernel indexes plain lists much faster than arrays
+            pts = pts.tolist()
+
+        code = _rules_kernel(int(ch1), int(ch2), pts)
+        if code == _NEXT:
+            return 'next'
+        if code == _BACKSPACE:
+            return 'Backspace'
+        return chr(code)
     
     def update_text_with_character(self, character):
         """
@@ -456,16 +686,17 @@ class SignLanguageRecognizer:
 
         # Handle "next" gesture for character confirmation
         if character == "next" and self.prev_char != "next":
-            if self.ten_prev_char[(self.count-2) % 10] != "next":
-                if self.ten_prev_char[(self.count-2) % 10] == "Backspace":
+            earlier = int(self.ten_prev_char[(self.count - 2) % 10])
+            if earlier != _CODE_NEXT:
+                if earlier == _CODE_BACKSPACE:
                     if len(self.recognized_text) > 0:
                         self.recognized_text = self.recognized_text[:-1]
-                else:
-                    if self.ten_prev_char[(self.count-2) % 10] not in ["Backspace", " ", "next"]:
-                        self.recognized_text += self.ten_prev_char[(self.count-2) % 10]
+                elif earlier != _CODE_BLANK:
+                    self.recognized_text += _RING_CHARS[earlier]
             else:
-                if self.ten_prev_char[self.count % 10] not in ["Backspace", " ", "next"]:
-                    self.recognized_text += self.ten_prev_char[self.count % 10]
+                latest = int(self.ten_prev_char[self.count % 10])
+                if latest not in (_CODE_BACKSPACE, _CODE_BLANK, _CODE_NEXT):
+                    self.recognized_text += _RING_CHARS[latest]
         
         # Handle space
         elif character == " " and self.prev_char != " ":
@@ -480,43 +711,59 @@ class SignLanguageRecognizer:
         self.prev_char = character
         self.current_symbol = character
         self.count += 1
-        self.ten_prev_char[self.count % 10] = character
+        self.ten_prev_char[self.count % 10] = _RING_CODES.get(character, _CODE_DASH)
         
-        # Update word suggestions
-        self.update_word_suggestions()
+        # Update word suggestions at most every suggestion_interval seconds,
+        # except right after an event that can change the current word
+        now = time.monotonic()
+        if character in ("next", " ", "Backspace") or now - self._last_suggestion_time > self.suggestion_interval:
+            self._last_suggestion_time = now
+            self.update_word_suggestions()
     
     def update_word_suggestions(self):
         """Update word suggestions based on current text"""
-        if not self.dictionary:
-            self.word_suggestions = [" ", " ", " ", " "]
+        # Most character events leave the current word unchanged
+        prefix = self.recognized_text[self.recognized_text.rfind(" ") + 1:]
+        if prefix == self._last_prefix:
             return
-            
+        
+        if len(self.recognized_text.strip()) != 0:
+            self.current_word = prefix
+        
         try:
-            if len(self.recognized_text.strip()) != 0:
-                # Get current word
-                last_space = self.recognized_text.rfind(" ")
-                current_word = self.recognized_text[last_space + 1:]
-                self.current_word = current_word
-                
-                if len(current_word.strip()) != 0:
-                    # Get dictionary suggestions
-                    suggestions = self.dictionary.suggest(current_word)
-                    
-                    # Fill suggestion array
-                    for i in range(4):
-                        if i < len(suggestions):
-                            self.word_suggestions[i] = suggestions[i]
-                        else:
-                            self.word_suggestions[i] = " "
-                else:
-                    self.word_suggestions = [" ", " ", " ", " "]
-            else:
-                self.word_suggestions = [" ", " ", " ", " "]
-                
+            self.word_suggestions = list(self._cached_suggestions(prefix))
+            self._last_prefix = prefix
         except Exception as e:
             logger.error(f"Error updating word suggestions: {e}")
             self.word_suggestions = [" ", " ", " ", " "]
     
+    def lookup_suggestions(self, prefix):
+        """
+        Compute the four word suggestions for a word prefix
+        
+        Args:
+            prefix: Current (partial) word
+            
+        Returns:
+            Tuple of four suggestions, padded with " "
+        """
+        if (not self.dictionary and not self.word_list) or len(prefix.strip()) == 0:
+            return (" ", " ", " ", " ")
+        
+        # Complete the prefix first; fall back to spell-checker
+        # corrections only when there are too few completions
+        suggestions = self.prefix_suggestions(prefix)
+        if len(suggestions) < 4 and self.dictionary:
+            seen = set(suggestions)
+            for word in self.dictionary.suggest(prefix):
+                if word.upper() not in seen:
+                    seen.add(word.upper())
+                    suggestions.append(word)
+                    if len(suggestions) == 4:
+                        break
+        
+        return tuple(suggestions[:4]) + (" ",) * (4 - len(suggestions[:4]))
+    
     def apply_word_suggestion(self, suggestion):
         """
         Apply a word suggestion to replace the current word
@@ -548,6 +795,53 @@ class SignLanguageRecognizer:
         self.word_suggestions = [" ", " ", " ", " "]
         self.reset_recognition_state()
     
+    def find_hands(self, detector, image):
+        """
+        Run a cvzone hand detector on an image
+        
+        Args:
+            detector: HandDetector instance
+            image: BGR image or crop
+            
+        Returns:
+            list: Detected hands (possibly empty)
+        """
+        hands_result = detector.findHands(image, draw=False, flipType=True)
+
+        # cvzone return shape differs across versions:
+        # - older/newer variants can return only allHands (list)
+        # - some variants return (allHands, image)
+        if isinstance(hands_result, tuple):
+            return hands_result[0] if len(hands_result) > 0 else []
+        return hands_result if isinstance(hands_result, list) else []
+    
+    def detect_hand(self, frame):
+        """
+        Locate the hand with a single full-frame detector pass
+        
+        Args:
+            frame: Input video frame (BGR format)
+            
+        Returns:
+            dict: Hand info with 'bbox' and 'lmList', or None
+        """
+        hands = self.find_hands(self.hd, frame)
+        return hands[0] if hands else None
+    
+    def draw_overlay(self, frame):
+        """
+        Draw the recognized text and current character on the frame
+        
+        Args:
+            frame: Video frame to draw on (modified in place)
+        """
+        if self.recognized_text:
+            cv2.putText(frame, f"Text: {self.recognized_text}", 
+                       (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2)
+        
+        cv2.putText(frame, f"Character: {self.current_symbol}", 
+                   (10, 60), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2)
+    
     def process_frame(self, frame):
         """
         Process a video frame for hand detection and recognition
@@ -560,18 +854,8 @@ class SignLanguageRecognizer:
         """
         try:
             # Detect hands in frame
-            hands_result = self.hd.findHands(frame, draw=False, flipType=True)
+            hand = self.detect_hand(frame)
 
-            # cvzone return shape differs across versions:
-            # - older/newer variants can return only allHands (list)
-            # - some variants return (allHands, image)
-            if isinstance(hands_result, tuple):
-                all_hands = hands_result[0] if len(hands_result) > 0 else []
-            else:
-                all_hands = hands_result if isinstance(hands_result, list) else []
-
-            frame_copy = np.array(frame)
-            
             # Initialize results
             results = {
                 'current_character': self.current_symbol,
@@ -581,82 +865,66 @@ class SignLanguageRecognizer:
                 'hand_detected': False
             }
             
-            if all_hands:  # Hand detected
-                results['hand_detected'] = True
-                hand_info = all_hands[0]
-                x, y, w, h = hand_info['bbox']
-                landmarks_full = hand_info.get('lmList', [])
+            # Idle frame: nothing to recognize, only the text overlay is drawn
+            if not hand:
+                self.draw_overlay(frame)
+                return frame, results
+            
+            results['hand_detected'] = True
+            x, y, w, h = hand['bbox']
+            landmarks_full = hand.get('lmList', [])
 
-                if not isinstance(landmarks_full, (list, tuple)) or len(landmarks_full) < 21:
+            if not isinstance(landmarks_full, (list, tuple)) or len(landmarks_full) < 21:
+                return frame, results
+            
+            # Hand region with offset, clipped to the frame; only its size
+            # matters, so degenerate regions skip the whole pipeline
+            y0, y1 = max(0, y - self.offset), min(frame.shape[0], y + h + self.offset)
+            x0, x1 = max(0, x - self.offset), min(frame.shape[1], x + w + self.offset)
+            
+            if y1 - y0 >= self.min_roi_size and x1 - x0 >= self.min_roi_size:
+                # Reset the model input to the white background; OpenCV draws
+                # the same pixels on float32 as on uint8, so no cast pass is needed
+                white = self._model_input[0]
+                np.copyto(white, self.white_template_f32)
+
+                # Use the primary detector's landmarks directly.
+                # Convert absolute frame coordinates into bbox-relative coordinates
+                # so the downstream skeleton logic matches the trained pipeline.
+                valid = [lm for lm in landmarks_full
+                         if isinstance(lm, (list, tuple)) and len(lm) >= 2]
+                if len(valid) < 21:
                     return frame, results
                 
-                # Extract hand region with offset
-                hand_region = frame_copy[
-                    max(0, y - self.offset):y + h + self.offset,
-                    max(0, x - self.offset):x + w + self.offset
-                ]
-                
-                if hand_region.size > 0:
-                    # Load white background for skeleton drawing
-                    try:
-                        white_bg_path = self.white_bg_path
-                        if not os.path.exists(white_bg_path):
-                            white_bg_path = os.path.join('..', self.white_bg_path)
-                        
-                        if os.path.exists(white_bg_path):
-                            white = cv2.imread(white_bg_path)
-                        else:
-                            # Create white background if file not found
-                            white = np.ones((400, 400, 3), dtype=np.uint8) * 255
-                    except:
-                        white = np.ones((400, 400, 3), dtype=np.uint8) * 255
-
-                    # Use the primary detector's landmarks directly.
-                    # Convert absolute frame coordinates into bbox-relative coordinates
-                    # so the downstream skeleton logic matches the trained pipeline.
-                    landmarks = []
-                    for lm in landmarks_full:
-                        if not isinstance(lm, (list, tuple)) or len(lm) < 2:
-                            continue
-                        landmarks.append([
-                            max(0, int(lm[0] - x)),
-                            max(0, int(lm[1] - y)),
-                            lm[2] if len(lm) > 2 else 0
-                        ])
-
-                    if len(landmarks) < 21:
-                        return frame, results
-
-                    # Draw hand skeleton
-                    skeleton_image = self.draw_hand_skeleton(white, landmarks, [0, 0, w, h])
-
-                    # Predict gesture
-                    predicted_char = self.predict_gesture(skeleton_image, landmarks)
-
-                    # Update text with prediction
-                    self.update_text_with_character(predicted_char)
-
-                    # Update results
-                    results.update({
-                        'current_character': self.current_symbol,
-                        'sentence': self.recognized_text,
-                        'word_suggestions': self.word_suggestions,
-                        'confidence': 0.85  # Placeholder confidence
-                    })
-
-                    # Draw bounding box and label on frame
-                    cv2.rectangle(frame, (x, y), (x + w, y + h), (0, 255, 0), 2)
-                    cv2.putText(frame, f"Detected: {self.current_symbol}",
-                               (x, y - 10), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
+                # One contiguous (N, 3) int32 array shared by drawing and rules
+                landmarks = np.empty((len(valid), 3), dtype=np.int32)
+                landmarks[:, :2] = np.maximum(np.array([lm[:2] for lm in valid]) - (x, y), 0)
+                landmarks[:, 2] = [lm[2] if len(lm) > 2 else 0 for lm in valid]
+
+                # Draw hand skeleton
+                skeleton_image = self.draw_hand_skeleton(white, landmarks, [0, 0, w, h])
+
+                # Predict gesture
+                predicted_char = self.predict_gesture(skeleton_image, landmarks)
+
+                # Update text with prediction
+                self.update_text_with_character(predicted_char)
+
+                # Update results
+                results.update({
+                    'current_character': self.current_symbol,
+                    'sentence': self.recognized_text,
+                    'word_suggestions': self.word_suggestions,
+                    'confidence': 0.85  # Placeholder confidence
+                })
+
+                # Draw bounding box and label on frame
+                cv2.rectangle(frame, (x, y), (x + w, y + h), (0, 255, 0), 2)
+                cv2.putText(frame, f"Detected: {self.current_symbol}",
+                           (x, y - 10), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
             
             # Add text overlay to frame
-            if self.recognized_text:
-                cv2.putText(frame, f"Text: {self.recognized_text}", 
-                           (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2)
-            
-            cv2.putText(frame, f"Character: {self.current_symbol}", 
-                       (10, 60), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2)
-            
+            self.draw_overlay(frame)
             return frame, results
             
         except Exception as e:
@@ -7,25 +7,135 @@ with proper threading and error handling.
 """
 
 import pyttsx3
+import os
+import sys
 import threading
 import time
 import logging
-from queue import Queue, Empty
+import logging.handlers
+import re
+from collections import OrderedDict, deque
+from queue import SimpleQueue
 
 logger = logging.getLogger(__name__)
 
+# Sentence boundaries: whitespace following terminal punctuation
+_SENTENCE_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Runs of whitespace, collapsed to a single space
+_WS_RE = re.compile(r'\s+')
+
+# Characters clean_text drops from non-ASCII text: anything that is not
+# alphanumeric, whitespace or .,!? (\w also matches '_', which is dropped)
+_STRIP_RE = re.compile(r'[^\w\s.,!?]+|_+')
+
+# str.translate table deleting the ASCII characters clean_text drops
+_ASCII_DELETE = dict.fromkeys(
+    code for code in range(128)
+    if not (chr(code).isalnum() or chr(code).isspace() or chr(code) in '.,!?')
+)
+
+
+class _RootForwarder(logging.Handler):
+    """Hand records to the root logger's handlers (runs on the listener thread)"""
+    
+    def emit(self, record):
+        logging.getLogger().handle(record)
+
+
+_log_lock = threading.Lock()
+_log_listener = None
+_log_handler = None
+
+
+def _start_log_listener():
+    """
+    Route this module's log records through a queue
+    
+    The speech worker then only enqueues records; a listener thread does the
+    formatting and handler I/O, so the worker never waits on the handler
+    locks shared with request threads.
+    """
+    global _log_listener, _log_handler
+    with _log_lock:
+        if _log_listener is not None:
+            return
+        log_queue = SimpleQueue()
+        _log_handler = logging.handlers.QueueHandler(log_queue)
+        _log_listener = logging.handlers.QueueListener(log_queue, _RootForwarder())
+        logger.addHandler(_log_handler)
+        logger.propagate = False
+        _log_listener.start()
+
+
+def _stop_log_listener():
+    """Flush queued log records, stop the listener and log directly again"""
+    global _log_listener, _log_handler
+    with _log_lock:
+        if _log_listener is None:
+            return
+        logger.removeHandler(_log_handler)
+        logger.propagate = True
+        _log_listener.stop()
+        _log_listener = None
+        _log_handler = None
+
+
+_start_log_listener()
+
+
+def _preview(text, limit):
+    """Shorten text to limit characters plus '...' for log messages"""
+    return text if len(text) <= limit else text[:limit] + '...'
+
+
 class SpeechSynthesis:
+    # Queued by shutdown() to end the worker loop
+    _STOP = object()
+    
     def __init__(self):
         """Initialize the Speech Synthesis system"""
+        _start_log_listener()
         self.engine = None
-        self.speech_queue = Queue()
+        self._voices = []
+        self._voice_by_id = {}
+        self._rate = None
+        self._volume = None
+        # Many producers (every Flask request thread, speak_immediately),
+        # one consumer (worker): deque append/popleft are atomic, so no lock
+        # is needed and the event only wakes the worker. Each
+        # item is one utterance (a tuple of sentences); when speech falls
+        # behind, the oldest pending utterance is dropped so audio stays
+        # close to the live captions
+        self.speech_queue = deque(maxlen=4)
+        # Priority lane for speak_immediately(), drained before speech_queue
+        self.urgent_queue = deque()
+        # (name, value) engine property changes for the worker to apply
+        self._property_updates = deque()
+        self.has_speech = threading.Event()
+        # Set by other threads to interrupt playback; the worker acts on it
+        # from the engine's callbacks, since only it may call engine.stop()
+        self._stop_requested = threading.Event()
         self.is_speaking = False
         self.speech_thread = None
-        self.stop_flag = threading.Event()
         self.engine_lock = threading.Lock()
+        self._init_attempted = False
+        # Set once the first engine initialization has been attempted
+        self._engine_ready = threading.Event()
+        self._shutting_down = False
+        
+        # Sentences the worker aims to hand the engine per runAndWait()
+        self.max_batch_size = 8
         
-        # Initialize TTS engine
-        self.initialize_engine()
+        # speak() drops a text already queued within the last dedup_window
+        # seconds; _recent maps recent texts to when they were queued
+        self.dedup_window = 2.0
+        self._recent = OrderedDict()
+        # speak() runs on every Flask request thread
+        self._recent_lock = threading.Lock()
+        
+        # The TTS engine is created on first use (see _ensure_engine), so
+        # processes that never speak skip the driver and voice enumeration
         
         # Start speech worker thread
         self.start_speech_worker()
@@ -38,13 +148,23 @@ class SpeechSynthesis:
             # Set speech properties
             self.engine.setProperty('rate', 150)  # Speed of speech
             self.engine.setProperty('volume', 0.9)  # Volume level (0.0 to 1.0)
+            # Mirror the properties so status reads never query the engine
+            self._rate = 150
+            self._volume = 0.9
+            
+            # Callbacks run on the worker inside runAndWait(), where a
+            # pending stop request is turned into engine.stop()
+            self.engine.connect('started-utterance', self._on_engine_progress)
+            self.engine.connect('started-word', self._on_engine_progress)
             
-            # Get available voices and set default
+            # Get available voices and set default; the list is cached since
+            # enumerating voices goes through the system speech API
             try:
-                voices = self.engine.getProperty('voices')
-                if voices and len(voices) > 0:
+                self._voices = list(self.engine.getProperty('voices') or [])
+                self._voice_by_id = {voice.id: voice for voice in self._voices}
+                if self._voices:
                     # Use first available voice (usually default system voice)
-                    first_voice = voices[0]
+                    first_voice = self._voices[0]
                     self.engine.setProperty('voice', first_voice.id)
                     logger.info(f"TTS engine initialized with voice: {first_voice.name}")
                 else:
@@ -58,39 +178,147 @@ class SpeechSynthesis:
             logger.error(f"Error initializing TTS engine: {e}")
             self.engine = None
     
+    def _ensure_engine(self):
+        """
+        Initialize the TTS engine the first time speech is needed
+        
+        Returns:
+            bool: True if the engine is available
+        """
+        if self.engine is None and not self._init_attempted:
+            with self.engine_lock:
+                if not self._init_attempted:
+                    self._init_attempted = True
+                    try:
+                        self.initialize_engine()
+                    finally:
+                        self._engine_ready.set()
+        return self.engine is not None
+    
+    def _wait_for_engine(self, timeout=5.0):
+        """
+        Have the worker initialize the engine if it has not yet, and wait
+        
+        Used by calls that need the engine's voice list before anything
+        has been spoken; the engine itself is still created on the worker.
+        
+        Args:
+            timeout: Seconds to wait for the initialization attempt
+            
+        Returns:
+            bool: True if the engine is available
+        """
+        if not self._engine_ready.is_set() and not self._shutting_down:
+            # An empty wake-up makes the worker run _ensure_engine()
+            self.has_speech.set()
+            self._engine_ready.wait(timeout)
+        return self.engine is not None
+    
+    def _on_engine_progress(self, *args, **kwargs):
+        """Engine callback (worker thread): stop playback if requested"""
+        if self._stop_requested.is_set() and self.engine:
+            self.engine.stop()
+    
     def start_speech_worker(self):
         """Start the background thread for speech synthesis"""
         if self.speech_thread is None or not self.speech_thread.is_alive():
-            self.stop_flag.clear()
             self.speech_thread = threading.Thread(target=self._speech_worker, daemon=True)
             self.speech_thread.start()
             logger.info("Speech worker thread started")
     
+    def _raise_worker_priority(self):
+        """
+        Raise the calling (worker) thread's scheduling priority, best effort
+        
+        Keeps playback from being preempted by request handling; runs
+        unprivileged deployments at the default priority.
+        """
+        try:
+            if sys.platform == 'win32':
+                import ctypes
+                kernel32 = ctypes.windll.kernel32
+                THREAD_PRIORITY_ABOVE_NORMAL = 1
+                if kernel32.SetThreadPriority(kernel32.GetCurrentThread(), THREAD_PRIORITY_ABOVE_NORMAL):
+                    logger.info("Speech worker priority raised")
+            elif sys.platform.startswith('linux'):
+                # On Linux the nice value is per thread, keyed by its native id
+                os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), -5)
+                logger.info("Speech worker priority raised")
+        except (OSError, AttributeError) as e:
+            logger.info(f"Could not raise speech worker priority: {e}")
+    
     def _speech_worker(self):
         """Background worker thread for processing speech requests"""
-        while not self.stop_flag.is_set():
+        self._raise_worker_priority()
+        
+        while True:
             try:
-                # Get speech request from queue (timeout to check stop flag)
-                speech_text = self.speech_queue.get(timeout=1.0)
+                # Block until speech is queued; shutdown() queues _STOP
+                self.has_speech.wait()
+                self.has_speech.clear()
+                if not self._shutting_down and self._ensure_engine():
+                    self._apply_property_updates()
                 
-                if speech_text and self.engine:
-                    self._speak_text(speech_text)
+                # Drain the queue in batches so the driver is armed once per
+                # batch rather than once per text
+                batch = self._next_batch()
+                while batch and not self._shutting_down:
+                    if self.engine:
+                        self._speak_batch(batch)
+                    batch = self._next_batch()
                 
-                self.speech_queue.task_done()
+                if batch is None or self._shutting_down:
+                    break
                 
-            except Empty:
-                # Timeout - continue loop to check stop flag
-                continue
             except Exception as e:
                 logger.error(f"Error in speech worker: {e}")
                 time.sleep(0.1)  # Brief pause before continuing
     
-    def _speak_text(self, text):
+    def _next_batch(self):
+        """
+        Pop pending utterances, urgent lane first, until the batch holds at
+        least max_batch_size sentences or both queues are empty
+        
+        Returns:
+            list: Sentences in queue order, empty when nothing is pending,
+                  or None once the _STOP sentinel is reached
+        """
+        batch = []
+        while len(batch) < self.max_batch_size:
+            queue = self.urgent_queue if self.urgent_queue else self.speech_queue
+            try:
+                utterance = queue.popleft()
+            except IndexError:
+                break
+            if utterance is self._STOP:
+                return None
+            batch.extend(utterance)
+        return batch
+    
+    def _enqueue(self, clean_text, urgent=False, split=True):
         """
-        Internal method to speak text using pyttsx3
+        Queue cleaned text as one utterance and wake the worker
         
         Args:
-            text: Text to speak
+            clean_text: Text already passed through clean_text()
+            urgent: Queue on the priority lane instead of speech_queue
+            split: Split the text into sentences (False for raw text)
+        """
+        utterance = tuple(self.split_sentences(clean_text)) if split else (clean_text,)
+        if urgent:
+            self.urgent_queue.append(utterance)
+        else:
+            if len(self.speech_queue) == self.speech_queue.maxlen:
+                logger.warning("Speech queue full, dropping oldest pending text")
+            self.speech_queue.append(utterance)
+        self.has_speech.set()
+    
+    def _speak_batch(self, texts):
+        """
+        Speak several texts with a single runAndWait() call
+        
+        Args:
+            texts: Non-empty list of texts to speak in order
         """
         try:
             if not self.engine:
@@ -99,13 +327,13 @@ class SpeechSynthesis:
             
             with self.engine_lock:
                 self.is_speaking = True
-                logger.info(f"Speaking: {text[:50]}{'...' if len(text) > 50 else ''}")
-
-                # Clear any previous speech
-                self.engine.stop()
 
-                # Speak the text
-                self.engine.say(text)
+                # Queue every text in the driver, then play them in one run
+                log_texts = logger.isEnabledFor(logging.INFO)
+                for text in texts:
+                    if log_texts:
+                        logger.info("Speaking: %s", _preview(text, 50))
+                    self.engine.say(text)
                 self.engine.runAndWait()
             
             logger.info("Speech synthesis completed")
@@ -116,6 +344,8 @@ class SpeechSynthesis:
             self.reinitialize_engine()
         finally:
             self.is_speaking = False
+            # A stop request only applies to the batch that was playing
+            self._stop_requested.clear()
     
     def speak(self, text):
         """
@@ -139,9 +369,25 @@ class SpeechSynthesis:
                 logger.warning("No speakable text after cleaning")
                 return False
             
-            # Add to speech queue
-            self.speech_queue.put(clean_text)
-            logger.info(f"Text queued for speech: {clean_text[:30]}{'...' if len(clean_text) > 30 else ''}")
+            # Skip repeats of something queued moments ago
+            now = time.monotonic()
+            with self._recent_lock:
+                queued_at = self._recent.get(clean_text)
+                repeated = queued_at is not None and now - queued_at < self.dedup_window
+                if not repeated:
+                    self._recent[clean_text] = now
+                    self._recent.move_to_end(clean_text)
+                    if len(self._recent) > 64:
+                        self._recent.popitem(last=False)
+            if repeated:
+                logger.info("Skipping repeated text for speech synthesis")
+                return False
+            
+            # Queue sentence by sentence so the worker can hand the next one
+            # to the driver while the current one is still playing
+            self._enqueue(clean_text)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Text queued for speech: %s", _preview(clean_text, 30))
             
             return True
             
@@ -149,27 +395,33 @@ class SpeechSynthesis:
             logger.error(f"Error queuing text for speech: {e}")
             return False
 
-    def speak_latest(self, text):
+    def speak_latest(self, text, raw=False):
         """
         Stop any current speech and queue only the latest text.
 
         This keeps the request path non-blocking so the UI can trigger
         speech repeatedly without waiting for the current utterance to end.
+        
+        Args:
+            text: Text to speak
+            raw: Text is already speakable (letters and spaces, as clean_text()
+                 would leave it) and is queued as is, unsplit
         """
         try:
             if not text or not text.strip():
                 logger.warning("Empty text provided for speech synthesis")
                 return False
 
-            clean_text = self.clean_text(text)
+            clean_text = text if raw else self.clean_text(text)
             if not clean_text:
                 logger.warning("No speakable text after cleaning")
                 return False
 
             self.stop_current_speech()
             self.clear_speech_queue()
-            self.speech_queue.put(clean_text)
-            logger.info(f"Latest text queued for speech: {clean_text[:30]}{'...' if len(clean_text) > 30 else ''}")
+            self._enqueue(clean_text, split=not raw)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Latest text queued for speech: %s", _preview(clean_text, 30))
             return True
         except Exception as e:
             logger.error(f"Error queueing latest speech text: {e}")
@@ -177,13 +429,16 @@ class SpeechSynthesis:
     
     def speak_immediately(self, text):
         """
-        Speak text immediately, bypassing the queue
+        Speak text ahead of anything queued, without waiting for playback
+        
+        Current speech is stopped and pending requests are dropped; the text
+        goes on the worker's priority lane, so the caller returns at once.
         
         Args:
             text: Text to speak
             
         Returns:
-            bool: True if speech was successful
+            bool: True if the text was queued for immediate speech
         """
         try:
             if not text or not text.strip():
@@ -196,8 +451,9 @@ class SpeechSynthesis:
             clean_text = self.clean_text(text)
             
             if clean_text:
-                # Speak immediately in current thread
-                self._speak_text(clean_text)
+                # Supersede everything pending and hand the text to the worker
+                self.clear_speech_queue()
+                self._enqueue(clean_text, urgent=True)
                 return True
             
             return False
@@ -217,11 +473,21 @@ class SpeechSynthesis:
             str: Cleaned text ready for speech
         """
         try:
+            # Bound the work up front: at most 1000 characters are spoken, and
+            # a small margin leaves room for characters removed below
+            if len(text) > 1100:
+                text = text[:1100]
+            
             # Remove extra whitespace
-            cleaned = ' '.join(text.split())
+            cleaned = _WS_RE.sub(' ', text).strip()
             
-            # Remove special characters that might cause issues
-            cleaned = ''.join(char for char in cleaned if char.isalnum() or char.isspace() or char in '.,!?')
+            # Remove special characters that might cause issues; ASCII text
+            # (all recognizer output) goes through str.translate, anything
+            # else through the Unicode-aware regex
+            if cleaned.isascii():
+                cleaned = cleaned.translate(_ASCII_DELETE)
+            else:
+                cleaned = _STRIP_RE.sub('', cleaned)
             
             # Ensure reasonable length
             if len(cleaned) > 1000:
@@ -234,25 +500,38 @@ class SpeechSynthesis:
             logger.error(f"Error cleaning text: {e}")
             return ""
     
+    def split_sentences(self, text):
+        """
+        Split cleaned text into sentences
+        
+        Args:
+            text: Cleaned text
+            
+        Returns:
+            list: Non-empty sentences in order
+        """
+        return [sentence for sentence in _SENTENCE_RE.split(text) if sentence]
+    
     def stop_current_speech(self):
-        """Stop any currently playing speech"""
+        """
+        Stop any currently playing speech
+        
+        Only signals the worker, which stops the engine at the next word or
+        sentence boundary; the engine is never touched from this thread.
+        """
         try:
             if self.engine and self.is_speaking:
-                self.engine.stop()
-                logger.info("Current speech stopped")
+                self._stop_requested.set()
+                logger.info("Current speech stop requested")
         except Exception as e:
             logger.error(f"Error stopping current speech: {e}")
     
     def clear_speech_queue(self):
         """Clear all pending speech requests"""
         try:
-            # Clear the queue
-            while not self.speech_queue.empty():
-                try:
-                    self.speech_queue.get_nowait()
-                    self.speech_queue.task_done()
-                except Empty:
-                    break
+            # Clear both lanes
+            self.urgent_queue.clear()
+            self.speech_queue.clear()
             
             logger.info("Speech queue cleared")
             
@@ -273,8 +552,11 @@ class SpeechSynthesis:
             
             # Create new engine
             self.engine = None
+            self._voices = []
+            self._voice_by_id = {}
             time.sleep(0.5)  # Brief pause
             
+            self._init_attempted = True
             self.initialize_engine()
             
         except Exception as e:
@@ -286,14 +568,21 @@ class SpeechSynthesis:
         
         Args:
             rate: Speech rate (words per minute, typically 100-300)
+            
+        Returns:
+            bool: True if the engine is available and the change was queued
+                  for the worker (applied before the next utterance)
         """
         try:
-            if self.engine and 100 <= rate <= 300:
-                self.engine.setProperty('rate', rate)
+            if not 100 <= rate <= 300:
+                logger.warning(f"Invalid speech rate: {rate}")
+                return False
+            if self._wait_for_engine():
+                self._set_engine_property('rate', rate)
                 logger.info(f"Speech rate set to {rate} WPM")
                 return True
             else:
-                logger.warning(f"Invalid speech rate: {rate}")
+                logger.warning("Cannot set speech rate, TTS engine not available")
                 return False
         except Exception as e:
             logger.error(f"Error setting speech rate: {e}")
@@ -305,19 +594,55 @@ class SpeechSynthesis:
         
         Args:
             volume: Volume level (0.0 to 1.0)
+            
+        Returns:
+            bool: True if the engine is available and the change was queued
+                  for the worker (applied before the next utterance)
         """
         try:
-            if self.engine and 0.0 <= volume <= 1.0:
-                self.engine.setProperty('volume', volume)
+            if not 0.0 <= volume <= 1.0:
+                logger.warning(f"Invalid volume level: {volume}")
+                return False
+            if self._wait_for_engine():
+                self._set_engine_property('volume', volume)
                 logger.info(f"Speech volume set to {volume}")
                 return True
             else:
-                logger.warning(f"Invalid volume level: {volume}")
+                logger.warning("Cannot set speech volume, TTS engine not available")
                 return False
         except Exception as e:
             logger.error(f"Error setting speech volume: {e}")
             return False
     
+    def _set_engine_property(self, name, value):
+        """
+        Schedule an engine property change on the worker thread
+        
+        pyttsx3 drivers are not thread-safe, so only the worker thread, which
+        owns the engine, calls setProperty.
+        
+        Args:
+            name: Engine property name ('rate', 'volume' or 'voice')
+            value: New property value
+        """
+        if name == 'rate':
+            self._rate = value
+        elif name == 'volume':
+            self._volume = value
+        self._property_updates.append((name, value))
+        self.has_speech.set()
+    
+    def _apply_property_updates(self):
+        """Apply scheduled property changes; called on the worker thread"""
+        while self._property_updates:
+            name, value = self._property_updates.popleft()
+            if name == 'rate':
+                self._rate = value
+            elif name == 'volume':
+                self._volume = value
+            with self.engine_lock:
+                self.engine.setProperty(name, value)
+    
     def get_available_voices(self):
         """
         Get list of available voices
@@ -326,15 +651,14 @@ class SpeechSynthesis:
             list: List of available voice information
         """
         try:
-            if not self.engine:
+            if not self._wait_for_engine():
                 return []
             
             try:
-                voices = self.engine.getProperty('voices')
                 voice_list = []
                 
-                if voices:
-                    for voice in voices:
+                if self._voices:
+                    for voice in self._voices:
                         voice_info = {
                             'id': voice.id,
                             'name': voice.name,
@@ -363,22 +687,17 @@ class SpeechSynthesis:
             bool: True if voice was set successfully
         """
         try:
-            if not self.engine:
+            if not self._wait_for_engine():
                 return False
             
-            try:
-                voices = self.engine.getProperty('voices')
-                if voices:
-                    for voice in voices:
-                        if voice.id == voice_id:
-                            self.engine.setProperty('voice', voice_id)
-                            logger.info(f"Voice set to: {voice.name}")
-                            return True
-            except (TypeError, AttributeError):
-                logger.error("Error setting voice")
+            voice = self._voice_by_id.get(voice_id)
+            if voice is None:
+                logger.warning(f"Voice ID not found: {voice_id}")
+                return False
             
-            logger.warning(f"Voice ID not found: {voice_id}")
-            return False
+            self._set_engine_property('voice', voice_id)
+            logger.info(f"Voice set to: {voice.name}")
+            return True
             
         except Exception as e:
             logger.error(f"Error setting voice: {e}")
@@ -391,7 +710,8 @@ class SpeechSynthesis:
         Returns:
             bool: True if engine is available
         """
-        return self.engine is not None
+        # Optimistic until the first lazy initialization has been tried
+        return self.engine is not None or not self._init_attempted
     
     def get_engine_status(self):
         """
@@ -404,25 +724,16 @@ class SpeechSynthesis:
             status = {
                 'engine_available': self.is_engine_available(),
                 'is_speaking': self.is_speaking,
-                'queue_size': self.speech_queue.qsize(),
+                'queue_size': len(self.urgent_queue) + len(self.speech_queue),
                 'worker_active': self.speech_thread.is_alive() if self.speech_thread else False
             }
             
             if self.engine:
-                try:
-                    voices = self.engine.getProperty('voices')
-                    voice_count = len(voices) if voices else 0
-                    status.update({
-                        'rate': self.engine.getProperty('rate'),
-                        'volume': self.engine.getProperty('volume'),
-                        'voice_count': voice_count
-                    })
-                except (TypeError, AttributeError):
-                    status.update({
-                        'rate': 'Unknown',
-                        'volume': 'Unknown',
-                        'voice_count': 0
-                    })
+                status.update({
+                    'rate': self._rate,
+                    'volume': self._volume,
+                    'voice_count': len(self._voices)
+                })
             
             return status
             
@@ -434,32 +745,35 @@ class SpeechSynthesis:
         """Shutdown the speech synthesis system"""
         try:
             logger.info("Shutting down speech synthesis system...")
+            self._shutting_down = True
             
-            # Stop worker thread
-            self.stop_flag.set()
-            
-            # Clear queue
+            # Clear queue, then wake the worker with the stop sentinel
             self.clear_speech_queue()
+            self.urgent_queue.append(self._STOP)
+            self.has_speech.set()
             
-            # Stop current speech
-            self.stop_current_speech()
+            # Ask the worker to interrupt any runAndWait() in progress; unlike
+            # stop_current_speech this does not depend on is_speaking, which
+            # may not be set yet
+            self._stop_requested.set()
             
             # Wait for worker thread to finish
             if self.speech_thread and self.speech_thread.is_alive():
-                self.speech_thread.join(timeout=2.0)
+                self.speech_thread.join(timeout=0.5)
             
-            # Cleanup engine
-            if self.engine:
-                try:
-                    self.engine.stop()
-                except:
-                    pass
+            # Release the engine once the worker no longer uses it
+            if self.speech_thread and self.speech_thread.is_alive():
+                logger.warning("Speech worker still busy, leaving engine to exit with it")
+            else:
                 self.engine = None
             
             logger.info("Speech synthesis system shutdown completed")
             
         except Exception as e:
             logger.error(f"Error during shutdown: {e}")
+        finally:
+            # Flush pending log records before the process exits
+            _stop_log_listener()
 
 
 # Example usage and testing
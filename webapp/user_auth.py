@@ -8,32 +8,148 @@ authentication system from the original desktop application.
 
 import json
 import hashlib
+import hmac
 import os
-from datetime import datetime
+import shutil
+import threading
+import atexit
+import time
+from pathlib import Path
 import re
 import logging
 
+try:
+    from argon2 import PasswordHasher
+    from argon2.exceptions import InvalidHashError, VerificationError
+except ImportError:
+    PasswordHasher = None
+
+try:
+    import bcrypt
+except ImportError:
+    bcrypt = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Argon2id tuned to finish in ~50 ms so logins don't stall Flask workers
+if PasswordHasher is not None:
+    _password_hasher = PasswordHasher(time_cost=2, memory_cost=32768, parallelism=2)
+else:
+    _password_hasher = None
+    if bcrypt is not None:
+        logger.warning("argon2-cffi not installed, falling back to bcrypt password hashes")
+    else:
+        logger.warning("argon2-cffi and bcrypt not installed, falling back to SHA-256 password hashes")
+
+# RFC 5321 limit; longer input is rejected before any regex work
+MAX_EMAIL_LENGTH = 254
+
+# Validation patterns, compiled once at import
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_USERNAME_RE = re.compile(r'^[a-zA-Z0-9_]+$')
+# At least 6 characters with one letter and one digit, checked in a single match
+_PASSWORD_RE = re.compile(r'(?=.*[a-zA-Z])(?=.*\d).{6,}', re.DOTALL)
+_SHA256_HEX_RE = re.compile(r'[0-9a-f]{64}')
+
+# bcrypt work factor used when argon2-cffi is unavailable
+BCRYPT_ROUNDS = 12
+BCRYPT_PREFIXES = ('$2a$', '$2b$', '$2y$')
+
+# Last formatted timestamp, reused for events within the same second
+_TS_CACHE = [0, '']
+
+
+def _dumps(obj):
+    """Serialize to compact JSON bytes (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def _loads(data):
+    """Parse JSON bytes (orjson when available)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _now_iso():
+    """Return the current local time as an ISO string at second resolution"""
+    t = int(time.time())
+    if t != _TS_CACHE[0]:
+        _TS_CACHE[:] = [t, time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(t))]
+    return _TS_CACHE[1]
+
+
 class UserAuthentication:
+    # Hash verified for unknown usernames so they take as long as real ones
+    _dummy_hash = None
+    
     def __init__(self, users_file='users.json'):
         """
         Initialize the User Authentication system
         
         Args:
-            users_file: Path to the JSON file storing user data
+            users_file: Path to the JSON file storing user data. A path ending
+                in .jsonl selects the append-only log format, where each change
+                appends one record instead of rewriting the whole file.
         """
         self.users_file = users_file
+        self._users_path = Path(users_file)
+        self.log_mode = users_file.endswith('.jsonl')
+        self._log_records = 0  # lines in the log, for compaction
+        self._log_torn = False
         self.users = self.load_users()
+        self._email_index = self.build_email_index()
+        
+        # Read-through caches for page renders, invalidated on every write
+        self._info_cache = {}
+        self._stats_cache = {}
+        
+        # Debounced writer: hot-path updates mark the database dirty and a
+        # timer flushes them in one write instead of one rewrite per event
+        self.flush_delay = 0.5  # seconds
+        self._dirty = False
+        self._dirty_users = set()  # users changed since the last write
+        self._flush_timer = None
+        self._save_lock = threading.Lock()
+        atexit.register(self._flush)
+        
+        # Rolling copies of the file in .bak/ next to it, taken before a full rewrite
+        self.backup_dir = self._users_path.parent / '.bak'
+        self.backup_count = 5
+        self.backup_interval = 3600  # seconds between backups
+        self._last_backup = 0.0
+        
+        # Session stats buffered as {username: (sessions, seconds)} until the next write
+        self._pending_stats = {}
+        self._stats_lock = threading.Lock()
+        
+        # Rewrite a damaged log before appending to it again
+        if self._log_torn:
+            self.save_users()
     
     def load_users(self):
-        """Load users from JSON file"""
-        if os.path.exists(self.users_file):
+        """Load users from JSON file (or replay the .jsonl log)"""
+        if self._users_path.exists():
             try:
-                with open(self.users_file, 'r') as f:
-                    users_data = json.load(f)
-                    logger.info(f"Loaded {len(users_data)} users from {self.users_file}")
-                    return users_data
+                if self.log_mode:
+                    users_data = self.replay_log()
+                else:
+                    with open(self.users_file, 'rb') as f:
+                        users_data = _loads(f.read())
+                # Give records from older versions the counters the hot paths expect
+                for user in users_data.values():
+                    user.setdefault('login_count', 0)
+                    user.setdefault('session_count', 0)
+                    user.setdefault('total_recognition_time', 0)
+                logger.info(f"Loaded {len(users_data)} users from {self.users_file}")
+                return users_data
             except (json.JSONDecodeError, FileNotFoundError) as e:
                 logger.error(f"Error loading users file: {e}")
                 return {}
@@ -41,20 +157,209 @@ class UserAuthentication:
             logger.info(f"Users file {self.users_file} not found, starting with empty database")
             return {}
     
+    def replay_log(self):
+        """
+        Rebuild the user database from the append-only log
+        
+        Returns:
+            dict: Users keyed by username
+        """
+        users_data = {}
+        with open(self.users_file, 'rb') as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    entry = _loads(line)
+                except json.JSONDecodeError:
+                    # A crash mid-append leaves at most one torn line
+                    logger.warning(f"Skipping unreadable line {line_number} in {self.users_file}")
+                    self._log_torn = True
+                    continue
+                self._log_records += 1
+                if entry['op'] == 'upsert':
+                    users_data[entry['u']] = entry['rec']
+                elif entry['op'] == 'delete':
+                    users_data.pop(entry['u'], None)
+        return users_data
+    
+    def build_email_index(self):
+        """
+        Build the email -> username lookup used for duplicate checks
+        
+        Returns:
+            dict: Mapping of registered email addresses to usernames
+        """
+        return {user['email']: name for name, user in self.users.items() if user.get('email')}
+    
     def save_users(self):
-        """Save users to JSON file"""
+        """
+        Save all users immediately (atomic replace)
+        
+        In log mode this writes a compacted snapshot of the log.
+        """
+        self._apply_pending_stats()
+        with self._save_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            self._dirty = False
+            try:
+                if self.log_mode:
+                    payload = b''.join(_dumps({'op': 'upsert', 'u': name, 'rec': user}) + b'\n'
+                                       for name, user in self.users.items())
+                else:
+                    payload = _dumps(self.users)
+                tmp_path = self._users_path.with_name(self._users_path.name + '.tmp')
+                tmp_path.write_bytes(payload)
+                self._backup_users_file()
+                os.replace(tmp_path, self._users_path)
+                self._log_records = len(self.users)
+                self._dirty_users.clear()
+                logger.info(f"Saved {len(self.users)} users to {self.users_file}")
+                return True
+            except Exception as e:
+                self._dirty = True
+                logger.error(f"Error saving users: {e}")
+                return False
+    
+    def _backup_users_file(self):
+        """Copy the current file into backup_dir, keeping the newest backup_count copies"""
+        now = time.time()
+        if now - self._last_backup < self.backup_interval or not self._users_path.exists():
+            return
         try:
-            with open(self.users_file, 'w') as f:
-                json.dump(self.users, f, indent=4)
-            logger.info(f"Saved {len(self.users)} users to {self.users_file}")
-            return True
-        except Exception as e:
-            logger.error(f"Error saving users: {e}")
-            return False
+            self.backup_dir.mkdir(exist_ok=True)
+            stem, suffix = self._users_path.stem, self._users_path.suffix
+            shutil.copy2(self._users_path, self.backup_dir / f"{stem}.{int(now)}{suffix}")
+            self._last_backup = now
+            for old_backup in sorted(self.backup_dir.glob(f"{stem}.*{suffix}"))[:-self.backup_count]:
+                old_backup.unlink()
+        except OSError as e:
+            logger.warning(f"Could not back up {self.users_file}: {e}")
+    
+    def compact(self):
+        """
+        Rewrite the log as a snapshot once it holds over twice as many records as users
+        
+        Compaction is best-effort: appended records are already durable, so a
+        failure is only logged and retried on the next append or flush.
+        
+        Returns:
+            bool: False if a due compaction failed
+        """
+        if self.log_mode and self._log_records > 2 * max(len(self.users), 1):
+            if not self.save_users():
+                logger.warning(f"Compaction of {self.users_file} failed, will retry")
+                return False
+        return True
+    
+    def _append_op(self, op, username, rec=None):
+        """
+        Append a single change to the log
+        
+        Args:
+            op: 'upsert' or 'delete'
+            username: User the change applies to
+            rec: Full user record for upserts
+            
+        Returns:
+            bool: True if the record was written
+        """
+        entry = {'op': op, 'u': username}
+        if rec is not None:
+            entry['rec'] = rec
+        return self._append_entries([entry])
+    
+    def _append_entries(self, entries):
+        """
+        Append log entries in a single write, compacting afterwards if due
+        
+        Args:
+            entries: List of log entry dicts
+            
+        Returns:
+            bool: True if the entries were written (regardless of compaction)
+        """
+        payload = b''.join(_dumps(entry) + b'\n' for entry in entries)
+        with self._save_lock:
+            try:
+                with open(self.users_file, 'ab') as f:
+                    f.write(payload)
+                self._log_records += len(entries)
+            except Exception as e:
+                logger.error(f"Error appending to user log: {e}")
+                return False
+        self.compact()
+        return True
+    
+    def _persist_user(self, username):
+        """
+        Durably save one user's change (or deletion)
+        
+        Appends a single record in log mode, otherwise rewrites the JSON file.
+        
+        Returns:
+            bool: True if successful
+        """
+        if not self.log_mode:
+            return self.save_users()
+        self._apply_pending_stats(username)
+        user = self.users.get(username)
+        if user is None:
+            return self._append_op('delete', username)
+        return self._append_op('upsert', username, user)
+    
+    def _mark_dirty(self, username):
+        """Schedule a deferred save of a user, coalescing updates within flush_delay"""
+        with self._save_lock:
+            self._dirty = True
+            self._dirty_users.add(username)
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.flush_delay, self._flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+    
+    def _flush(self):
+        """
+        Write pending changes if any (timer callback and exit hook)
+        
+        In log mode only the changed users are appended; otherwise the
+        whole file is rewritten.
+        """
+        if not self._dirty:
+            return
+        if not self.log_mode:
+            self.save_users()
+            return
+        
+        with self._save_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            self._dirty = False
+            dirty_users, self._dirty_users = self._dirty_users, set()
+        
+        self._apply_pending_stats()
+        entries = []
+        for name in dirty_users:
+            user = self.users.get(name)
+            if user is None:
+                entries.append({'op': 'delete', 'u': name})
+            else:
+                entries.append({'op': 'upsert', 'u': name, 'rec': user})
+        if not entries:
+            # Only a failed compaction was pending
+            self.compact()
+        elif not self._append_entries(entries):
+            # Retry these users with the next write
+            with self._save_lock:
+                self._dirty = True
+                self._dirty_users |= dirty_users
     
     def hash_password(self, password):
         """
-        Hash password using SHA-256
+        Hash password using Argon2id (bcrypt, then SHA-256, if argon2-cffi is unavailable)
         
         Args:
             password: Plain text password
@@ -62,8 +367,79 @@ class UserAuthentication:
         Returns:
             Hashed password string
         """
+        if _password_hasher is not None:
+            return _password_hasher.hash(password)
+        if bcrypt is not None:
+            return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode()
         return hashlib.sha256(password.encode()).hexdigest()
     
+    def verify_password(self, password, stored_hash):
+        """
+        Check a plain text password against a stored hash
+        
+        Args:
+            password: Plain text password
+            stored_hash: Argon2id, bcrypt or legacy SHA-256 hash from the user record
+            
+        Returns:
+            bool: True if the password matches
+        """
+        if stored_hash.startswith('$argon2'):
+            if _password_hasher is None:
+                logger.error("Cannot verify Argon2 hash without argon2-cffi installed")
+                return False
+            try:
+                return _password_hasher.verify(stored_hash, password)
+            except (VerificationError, InvalidHashError):
+                return False
+        if stored_hash.startswith(BCRYPT_PREFIXES):
+            if bcrypt is None:
+                logger.error("Cannot verify bcrypt hash without bcrypt installed")
+                return False
+            try:
+                return bcrypt.checkpw(password.encode(), stored_hash.encode())
+            except ValueError:
+                return False
+        # Legacy SHA-256: constant-time compare (Argon2/bcrypt verify already are)
+        return hmac.compare_digest(stored_hash.encode(), hashlib.sha256(password.encode()).hexdigest().encode())
+    
+    def is_well_formed_hash(self, stored_hash):
+        """
+        Cheap format check run before any hashing work
+        
+        Args:
+            stored_hash: Value of the user's password field
+            
+        Returns:
+            bool: True if it looks like an Argon2, bcrypt or SHA-256 hash
+        """
+        if not isinstance(stored_hash, str):
+            return False
+        if stored_hash.startswith('$argon2'):
+            return True
+        if stored_hash.startswith(BCRYPT_PREFIXES):
+            return len(stored_hash) == 60
+        return _SHA256_HEX_RE.fullmatch(stored_hash) is not None
+    
+    def password_needs_rehash(self, stored_hash):
+        """
+        Check whether a stored hash should be upgraded to the current parameters
+        
+        Args:
+            stored_hash: Hash from the user record
+            
+        Returns:
+            bool: True if the hash is weaker than the best available scheme
+        """
+        if _password_hasher is not None:
+            if not stored_hash.startswith('$argon2'):
+                return True
+            return _password_hasher.check_needs_rehash(stored_hash)
+        if bcrypt is not None:
+            # Only upgrade legacy SHA-256; Argon2 hashes are left for when argon2-cffi returns
+            return not stored_hash.startswith(BCRYPT_PREFIXES + ('$argon2',))
+        return False
+    
     def validate_email(self, email):
         """
         Validate email format using regex
@@ -74,8 +450,9 @@ class UserAuthentication:
         Returns:
             bool: True if valid email format
         """
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
+        if not email or len(email) > MAX_EMAIL_LENGTH:
+            return False
+        return _EMAIL_RE.match(email) is not None
     
     def validate_username(self, username):
         """
@@ -89,7 +466,7 @@ class UserAuthentication:
         """
         if len(username) < 3 or len(username) > 20:
             return False
-        return re.match(r'^[a-zA-Z0-9_]+$', username) is not None
+        return _USERNAME_RE.match(username) is not None
     
     def validate_password(self, password):
         """
@@ -101,11 +478,7 @@ class UserAuthentication:
         Returns:
             bool: True if password meets requirements (min 6 chars, 1 letter, 1 number)
         """
-        if len(password) < 6:
-            return False
-        has_letter = re.search(r'[a-zA-Z]', password)
-        has_digit = re.search(r'\d', password)
-        return has_letter and has_digit
+        return _PASSWORD_RE.match(password) is not None
     
     def register_user(self, username, email, password, full_name=""):
         """
@@ -142,7 +515,7 @@ class UserAuthentication:
                 return False, "Username already exists"
             
             # Check if email already exists
-            if any(user.get('email') == email for user in self.users.values()):
+            if email in self._email_index:
                 return False, "Email already registered"
             
             # Create user data
@@ -151,7 +524,7 @@ class UserAuthentication:
                 'email': email,
                 'password': self.hash_password(password),
                 'full_name': full_name,
-                'created_at': datetime.now().isoformat(),
+                'created_at': _now_iso(),
                 'last_login': None,
                 'login_count': 0,
                 'session_count': 0,
@@ -160,14 +533,16 @@ class UserAuthentication:
             
             # Add user to database
             self.users[username] = user_data
+            self._email_index[email] = username
             
             # Save to file
-            if self.save_users():
+            if self._persist_user(username):
                 logger.info(f"New user registered: {username} ({email})")
                 return True, "User registered successfully"
             else:
                 # Remove user if save failed
                 del self.users[username]
+                del self._email_index[email]
                 return False, "Error saving user data"
                 
         except Exception as e:
@@ -187,27 +562,39 @@ class UserAuthentication:
         """
         try:
             # Check if user exists
-            if username not in self.users:
+            user = self.users.get(username)
+            if user is None:
+                # Spend the same hashing time as a real user to resist username enumeration
+                if UserAuthentication._dummy_hash is None:
+                    UserAuthentication._dummy_hash = self.hash_password('dummy-password')
+                self.verify_password(password, UserAuthentication._dummy_hash)
                 logger.warning(f"Login attempt with non-existent username: {username}")
                 return False, "Invalid username or password", None
             
-            user = self.users[username]
+            # Reject corrupted records without hashing anything
+            if not self.is_well_formed_hash(user.get('password')):
+                logger.error(f"Malformed password hash for user: {username}")
+                return False, "Invalid username or password", None
             
             # Check password
-            if user['password'] != self.hash_password(password):
+            if not self.verify_password(password, user['password']):
                 logger.warning(f"Invalid password attempt for user: {username}")
                 return False, "Invalid username or password", None
             
+            # Migrate legacy hashes on first successful login
+            if self.password_needs_rehash(user['password']):
+                user['password'] = self.hash_password(password)
+            
             # Update login information
-            self.users[username]['last_login'] = datetime.now().isoformat()
-            self.users[username]['login_count'] += 1
+            user['last_login'] = _now_iso()
+            user['login_count'] += 1
+            self._invalidate_cache(username)
             
-            # Save updated user data
-            self.save_users()
+            # Persist with the next batched write
+            self._mark_dirty(username)
             
             # Return user info (without password)
-            user_info = user.copy()
-            del user_info['password']
+            user_info = {k: v for k, v in user.items() if k != 'password'}
             
             logger.info(f"Successful login for user: {username}")
             return True, "Login successful", user_info
@@ -220,23 +607,26 @@ class UserAuthentication:
         """
         Get user information (without password)
         
+        The returned dict is cached and shared between calls; copy it
+        before adding fields.
+        
         Args:
             username: Username to get info for
             
         Returns:
             dict: User information or None if not found
         """
-        if username in self.users:
-            user_info = self.users[username].copy()
-            # Remove sensitive information
-            if 'password' in user_info:
-                del user_info['password']
-            return user_info
-        return None
+        user_info = self._info_cache.get(username)
+        if user_info is None and username in self.users:
+            self._apply_pending_stats(username)
+            # Copy everything except sensitive information
+            user_info = {k: v for k, v in self.users[username].items() if k != 'password'}
+            self._info_cache[username] = user_info
+        return user_info
     
     def update_user_password(self, username, old_password, new_password):
         """
-        Update user password
+        Update user password (alias of change_password)
         
         Args:
             username: Username
@@ -246,31 +636,7 @@ class UserAuthentication:
         Returns:
             tuple: (success: bool, message: str)
         """
-        try:
-            if username not in self.users:
-                return False, "User not found"
-            
-            # Verify current password
-            if self.users[username]['password'] != self.hash_password(old_password):
-                return False, "Current password is incorrect"
-            
-            # Validate new password
-            if not self.validate_password(new_password):
-                return False, "New password must be at least 6 characters with letters and numbers"
-            
-            # Update password
-            self.users[username]['password'] = self.hash_password(new_password)
-            
-            # Save changes
-            if self.save_users():
-                logger.info(f"Password updated for user: {username}")
-                return True, "Password updated successfully"
-            else:
-                return False, "Error saving password update"
-                
-        except Exception as e:
-            logger.error(f"Password update error: {e}")
-            return False, f"Password update failed: {str(e)}"
+        return self.change_password(username, old_password, new_password)
     
     def change_password(self, username, current_password, new_password):
         """
@@ -285,11 +651,12 @@ class UserAuthentication:
             tuple: (success: bool, message: str)
         """
         try:
-            if username not in self.users:
+            user = self.users.get(username)
+            if user is None:
                 return False, "User not found"
             
             # Verify current password
-            if self.users[username]['password'] != self.hash_password(current_password):
+            if not self.verify_password(current_password, user['password']):
                 return False, "Current password is incorrect"
             
             # Validate new password
@@ -297,10 +664,10 @@ class UserAuthentication:
                 return False, "New password must be at least 6 characters with letters and numbers"
             
             # Update password
-            self.users[username]['password'] = self.hash_password(new_password)
+            user['password'] = self.hash_password(new_password)
             
             # Save changes
-            if self.save_users():
+            if self._persist_user(username):
                 logger.info(f"Password changed for user: {username}")
                 return True, "Password changed successfully"
             else:
@@ -322,18 +689,21 @@ class UserAuthentication:
             tuple: (success: bool, message: str)
         """
         try:
-            if username not in self.users:
+            user = self.users.get(username)
+            if user is None:
                 return False, "User not found"
             
             # Verify password
-            if self.users[username]['password'] != self.hash_password(password):
+            if not self.verify_password(password, user['password']):
                 return False, "Incorrect password"
             
             # Delete user
+            self._drop_email(username)
             del self.users[username]
+            self._invalidate_cache(username)
             
             # Save changes
-            if self.save_users():
+            if self._persist_user(username):
                 logger.info(f"Account deleted for user: {username}")
                 return True, "Account deleted successfully"
             else:
@@ -356,14 +726,16 @@ class UserAuthentication:
             tuple: (success: bool, message: str)
         """
         try:
-            if username not in self.users:
+            user = self.users.get(username)
+            if user is None:
                 return False, "User not found"
             
             updated_fields = []
             
             # Update full name if provided
             if full_name is not None and full_name.strip():
-                self.users[username]['full_name'] = full_name.strip()
+                user['full_name'] = full_name.strip()
+                self._invalidate_cache(username)
                 updated_fields.append('full name')
             
             # Update email if provided
@@ -373,16 +745,21 @@ class UserAuthentication:
                     return False, "Invalid email format"
                 
                 # Check if email already exists for another user
-                if any(user.get('email') == email and user_username != username 
-                       for user_username, user in self.users.items()):
+                email = email.strip()
+                if self._email_index.get(email) not in (None, username):
                     return False, "Email already registered to another user"
                 
-                self.users[username]['email'] = email.strip()
+                old_email = user.get('email')
+                if self._email_index.get(old_email) == username:
+                    del self._email_index[old_email]
+                self._email_index[email] = username
+                user['email'] = email
+                self._invalidate_cache(username)
                 updated_fields.append('email')
             
             if updated_fields:
                 # Save changes
-                if self.save_users():
+                if self._persist_user(username):
                     logger.info(f"Profile updated for user {username}: {updated_fields}")
                     return True, f"Updated: {', '.join(updated_fields)}"
                 else:
@@ -406,8 +783,10 @@ class UserAuthentication:
         """
         try:
             if username in self.users:
+                self._drop_email(username)
                 del self.users[username]
-                success = self.save_users()
+                self._invalidate_cache(username)
+                success = self._persist_user(username)
                 if success:
                     logger.info(f"User deleted: {username}")
                 return success
@@ -416,6 +795,17 @@ class UserAuthentication:
             logger.error(f"User deletion error: {e}")
             return False
     
+    def _invalidate_cache(self, username):
+        """Drop cached info/stats for a user after their record changes"""
+        self._info_cache.pop(username, None)
+        self._stats_cache.pop(username, None)
+    
+    def _drop_email(self, username):
+        """Remove a user's address from the email index"""
+        email = self.users[username].get('email')
+        if self._email_index.get(email) == username:
+            del self._email_index[email]
+    
     def get_user_stats(self, username):
         """
         Get user statistics
@@ -424,36 +814,65 @@ class UserAuthentication:
             username: Username
             
         Returns:
-            dict: User statistics or None
+            dict: User statistics or None (cached and shared between calls)
         """
-        if username in self.users:
+        stats = self._stats_cache.get(username)
+        if stats is None and username in self.users:
+            self._apply_pending_stats(username)
             user = self.users[username]
-            return {
-                'login_count': user.get('login_count', 0),
-                'session_count': user.get('session_count', 0),
-                'total_recognition_time': user.get('total_recognition_time', 0),
+            stats = {
+                'login_count': user['login_count'],
+                'session_count': user['session_count'],
+                'total_recognition_time': user['total_recognition_time'],
                 'member_since': user.get('created_at', ''),
                 'last_login': user.get('last_login', '')
             }
-        return None
+            self._stats_cache[username] = stats
+        return stats
     
     def update_session_stats(self, username, session_duration=0):
         """
         Update user session statistics
         
+        The update is buffered and folded into the user record on the next
+        write or stats/info read.
+        
         Args:
             username: Username
             session_duration: Session duration in seconds
         """
         try:
             if username in self.users:
-                self.users[username]['session_count'] = self.users[username].get('session_count', 0) + 1
-                self.users[username]['total_recognition_time'] = self.users[username].get('total_recognition_time', 0) + session_duration
-                self.save_users()
+                with self._stats_lock:
+                    sessions, seconds = self._pending_stats.get(username, (0, 0))
+                    self._pending_stats[username] = (sessions + 1, seconds + session_duration)
+                self._invalidate_cache(username)
+                self._mark_dirty(username)
                 logger.info(f"Updated session stats for {username}: +{session_duration}s")
         except Exception as e:
             logger.error(f"Error updating session stats: {e}")
     
+    def _apply_pending_stats(self, username=None):
+        """
+        Fold buffered session stats into the user records
+        
+        Args:
+            username: Only apply this user's stats (all users if None)
+        """
+        with self._stats_lock:
+            if username is None:
+                pending, self._pending_stats = self._pending_stats, {}
+            elif username in self._pending_stats:
+                pending = {username: self._pending_stats.pop(username)}
+            else:
+                return
+        for name, (sessions, seconds) in pending.items():
+            user = self.users.get(name)
+            if user is not None:
+                user['session_count'] += sessions
+                user['total_recognition_time'] += seconds
+                self._invalidate_cache(name)
+    
     def list_all_users(self):
         """
         Get list of all usernames (admin function)
@@ -483,35 +902,3 @@ class UserAuthentication:
             int: Number of users
         """
         return len(self.users)
-
-
-# Example usage and testing
-if __name__ == "__main__":
-    # Test the authentication system
-    auth = UserAuthentication('test_users.json')
-    
-    print("Testing User Authentication System...")
-    
-    # Test registration
-    success, message = auth.register_user("testuser", "test@example.com", "password123", "Test User")
-    print(f"Registration: {success} - {message}")
-    
-    # Test login
-    success, message, user_info = auth.authenticate_user("testuser", "password123")
-    print(f"Login: {success} - {message}")
-    if user_info:
-        print(f"User info: {user_info}")
-    
-    # Test invalid login
-    success, message, user_info = auth.authenticate_user("testuser", "wrongpassword")
-    print(f"Invalid login: {success} - {message}")
-    
-    # Test user stats
-    stats = auth.get_user_stats("testuser")
-    print(f"User stats: {stats}")
-    
-    print(f"Total users: {auth.get_user_count()}")
-    
-    # Clean up test file
-    if os.path.exists('test_users.json'):
-        os.remove('test_users.json')
\ No newline at end of file